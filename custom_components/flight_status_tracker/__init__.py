@@ -2,13 +2,16 @@
 from __future__ import annotations
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 
-from .const import DOMAIN, PLATFORMS
+from .const import DOMAIN, EVENT_UPDATED, PLATFORMS, SIGNAL_UPDATED
+from .manual_store import async_list_manual_flights
 from .services import async_register_services
 from .services_preview import async_register_preview_services
 from .directory import async_refresh_builtin_airports_cache
 from .providers.airportsdata.directory import AIRPORTSDATA_AIRPORTS_URL
+from .providers.openflights.directory import async_preload_openflights
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -36,6 +39,32 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if changed:
         hass.config_entries.async_update_entry(entry, options=options)
 
+    # Cache option values read on hot paths (e.g. button presses) so they
+    # don't re-scan config entries; refreshed whenever options change.
+    def _cache_options() -> None:
+        try:
+            hours = int(entry.options.get("include_past_hours", 6))
+        except Exception:
+            hours = 6
+        hass.data.setdefault(DOMAIN, {})["include_past_hours"] = hours
+
+    async def _options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+        _cache_options()
+
+    _cache_options()
+    entry.async_on_unload(entry.add_update_listener(_options_updated))
+
+    # Bridge the public EVENT_UPDATED bus event to an in-process dispatcher
+    # signal once, so each entity connects to the dispatcher instead of
+    # registering its own bus listener. Must be a @callback: a bare
+    # callable would be dispatched to an executor thread, and
+    # async_dispatcher_send has to run in the event loop.
+    @callback
+    def _bridge_updated(_event) -> None:
+        async_dispatcher_send(hass, SIGNAL_UPDATED)
+
+    entry.async_on_unload(hass.bus.async_listen(EVENT_UPDATED, _bridge_updated))
+
     # Register manual flight services (add/remove/clear)
     await async_register_services(hass)
 
@@ -45,6 +74,39 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Refresh built-in airports cache on reload if empty/stale
     await async_refresh_builtin_airports_cache(hass, _options_provider())
 
+    # Warm the ZoneInfo cache for zones used by known flights so the first
+    # sensor render doesn't pay the synchronous tzdata read on the loop.
+    async def _warm_tz() -> None:
+        try:
+            flights = await async_list_manual_flights(hass)
+        except Exception:
+            return
+        zones = {
+            tz
+            for f in flights
+            for tz in (f.get("dep_airport_tz"), f.get("arr_airport_tz"))
+            if isinstance(tz, str) and tz
+        }
+        if not zones:
+            return
+
+        def _warm() -> None:
+            from zoneinfo import ZoneInfo
+
+            for tz in zones:
+                try:
+                    ZoneInfo(tz)
+                except Exception:
+                    pass
+
+        await hass.async_add_executor_job(_warm)
+
+    hass.async_create_task(_warm_tz())
+
+    # Build the OpenFlights fallback indices in the background so the
+    # first directory miss is a dict probe instead of a download+parse.
+    hass.async_create_task(async_preload_openflights(hass))
+
     # Load sensor/button/select/etc platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
@@ -1,15 +1,20 @@
 """Binary sensors for Flight Dashboard."""
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import async_track_state_change_event
 
-from .const import DOMAIN, EVENT_UPDATED
-from .selected import get_selected_flight, get_flight_position
+from .const import DOMAIN, SIGNAL_UPDATED
+from .selected import SELECT_ENTITY_ID, UPCOMING_SENSOR, get_selected_flight, get_flight_position
+
+# Built once; async_track_state_change_event indexes the iterable internally.
+_TRACKED_ENTITY_IDS = (UPCOMING_SENSOR, SELECT_ENTITY_ID)
 
 
 class FlightDashboardSelectedHasPositionBinarySensor(BinarySensorEntity):
@@ -20,51 +25,83 @@ class FlightDashboardSelectedHasPositionBinarySensor(BinarySensorEntity):
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         self.hass = hass
         self.entry = entry
-        self._unsub_state = None
-        self._unsub_bus = None
         self._is_on = False
         self._flight: dict[str, Any] | None = None
+        self._pos: dict[str, Any] | None = None
+        self._refresh_pending = False
+        self._kick_handle: asyncio.TimerHandle | None = None
+        self._last_signature: tuple | None = None
+        # Pre-bound references for the hot refresh path (skips the attribute
+        # lookup per call; these never change across the entity's lifetime).
+        self._get_pos = get_flight_position
+        self._write = self.async_write_ha_state
 
     async def async_added_to_hass(self) -> None:
         @callback
         def _kick(_event=None) -> None:
-            self.hass.async_create_task(self._refresh())
+            # State-change and bus listeners can fire back-to-back within one
+            # refresh cycle; coalesce the burst into a single refresh task.
+            # The coroutine is only allocated on the leading edge, inside the
+            # deferred callback.
+            if self._refresh_pending:
+                return
+            self._refresh_pending = True
+
+            def _schedule() -> None:
+                self._kick_handle = None
+                self.hass.async_create_task(
+                    self._refresh(), name="flight_status_tracker_has_position_refresh"
+                )
 
-        self._unsub_state = async_track_state_change_event(
-            self.hass,
-            ["sensor.flight_status_tracker_upcoming_flights", "select.flight_status_tracker_selected_flight"],
-            _kick,
+            self._kick_handle = self.hass.loop.call_later(0.05, _schedule)
+
+        # Let HA's entity teardown list run the unsubscribes on removal,
+        # and cancel any deferred kick so it can't fire after removal and
+        # write state on a removed entity.
+        @callback
+        def _cancel_kick() -> None:
+            if self._kick_handle is not None:
+                self._kick_handle.cancel()
+                self._kick_handle = None
+
+        self.async_on_remove(_cancel_kick)
+        self.async_on_remove(
+            async_track_state_change_event(self.hass, _TRACKED_ENTITY_IDS, _kick)
         )
-        self._unsub_bus = self.hass.bus.async_listen(EVENT_UPDATED, _kick)
+        self.async_on_remove(async_dispatcher_connect(self.hass, SIGNAL_UPDATED, _kick))
 
         await self._refresh()
 
-    async def async_will_remove_from_hass(self) -> None:
-        if self._unsub_state:
-            self._unsub_state()
-            self._unsub_state = None
-        if self._unsub_bus:
-            self._unsub_bus()
-            self._unsub_bus = None
-
     @property
     def is_on(self) -> bool:
         return self._is_on
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        pos = get_flight_position(self._flight)
+        # Position is computed once per refresh; the property just reads it.
         return {
             "flight_key": (self._flight or {}).get("flight_key"),
-            "latitude": (pos or {}).get("lat"),
-            "longitude": (pos or {}).get("lon"),
+            "latitude": (self._pos or {}).get("lat"),
+            "longitude": (self._pos or {}).get("lon"),
         }
 
     async def _refresh(self) -> None:
+        self._refresh_pending = False
         self._flight = get_selected_flight(self.hass)
-        pos = get_flight_position(self._flight)
+        pos = self._pos = self._get_pos(self._flight)
         self._is_on = bool(pos and pos.get("lat") is not None and pos.get("lon") is not None)
-        self.async_write_ha_state()
+        # Skip the state write (serialization + websocket push) when nothing
+        # the entity exposes has changed.
+        sig = (
+            self._is_on,
+            (self._flight or {}).get("flight_key"),
+            (pos or {}).get("lat"),
+            (pos or {}).get("lon"),
+        )
+        if sig == self._last_signature:
+            return
+        self._last_signature = sig
+        self._write()
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:
@@ -2,12 +2,13 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
+from datetime import datetime, timezone
 import logging
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN, EVENT_UPDATED
@@ -37,38 +38,44 @@ async def _notify(_hass: HomeAssistant, title: str, message: str) -> None:
 
 
 def _extract_flight_key(selected: str) -> str:
-    if " | " not in selected:
-        return ""
-    return selected.split(" | ", 1)[0].strip()
+    head, sep, _rest = selected.partition(" | ")
+    return head.strip() if sep else ""
 
 
 def _is_visible_in_upcoming(hass: HomeAssistant, flight_key: str) -> bool:
     st = hass.states.get(UPCOMING_SENSOR)
     if not st:
         return False
-    flights = st.attributes.get("flights") or []
-    return any(isinstance(f, dict) and f.get("flight_key") == flight_key for f in flights)
+    # Prefer the precomputed key index when the sensor exposes one.
+    keys = st.attributes.get("flight_key_set")
+    if isinstance(keys, (set, frozenset, list, tuple)):
+        return flight_key in keys
+    # Fallback scan; the producer guarantees dict entries.
+    for f in st.attributes.get("flights") or ():
+        if f.get("flight_key") == flight_key:
+            return True
+    return False
+
+
+try:
+    from ciso8601 import parse_datetime as _parse_dt_fast
+except ImportError:
+    def _parse_dt_fast(s: str) -> datetime:
+        return datetime.fromisoformat(s if "Z" not in s else s.replace("Z", "+00:00"))
 
 
 def _parse_iso(s: str | None) -> datetime | None:
     if not s:
         return None
     try:
-        return datetime.fromisoformat(s.replace("Z", "+00:00"))
+        return _parse_dt_fast(s)
     except Exception:
         return None
 
 
 def _get_include_past_hours(hass: HomeAssistant) -> int:
-    # Read current options from the first config entry
-    entries = hass.config_entries.async_entries(DOMAIN)
-    if not entries:
-        return 6
-    opts = dict(entries[0].options or {})
-    try:
-        return int(opts.get("include_past_hours", 6))
-    except Exception:
-        return 6
+    # Cached in hass.data by async_setup_entry; refreshed on options update.
+    return hass.data.get(DOMAIN, {}).get("include_past_hours", 6)
 
 
 class FlightDashboardRemoveSelectedFlightButton(ButtonEntity):
@@ -94,43 +101,48 @@ class FlightDashboardRemoveSelectedFlightButton(ButtonEntity):
         )
 
 
-class FlightDashboardClearManualFlightsButton(ButtonEntity):
-    _attr_name = "Flight Dashboard Clear Manual Flights"
-    _attr_unique_id = "flight_status_tracker_clear_manual_flights"
-    _attr_icon = "mdi:delete-sweep"
-    _attr_suggested_object_id = "flight_status_tracker_clear_manual_flights"
-
-    def __init__(self, hass: HomeAssistant) -> None:
-        self.hass = hass
-
-    async def async_press(self) -> None:
-        await self.hass.services.async_call(DOMAIN, SERVICE_CLEAR, {}, blocking=True)
-
-
-class FlightDashboardRefreshNowButton(ButtonEntity):
-    _attr_name = "Flight Dashboard Refresh Now"
-    _attr_unique_id = "flight_status_tracker_refresh_now"
-    _attr_icon = "mdi:refresh"
-    _attr_suggested_object_id = "flight_status_tracker_refresh_now"
+class FlightDashboardServiceButton(ButtonEntity):
+    """Button whose press is a plain service call; configured from a table."""
 
-    def __init__(self, hass: HomeAssistant) -> None:
+    def __init__(self, hass: HomeAssistant, name: str, unique_id: str, icon: str, service: str) -> None:
         self.hass = hass
+        self._attr_name = name
+        self._attr_unique_id = unique_id
+        self._attr_icon = icon
+        self._attr_suggested_object_id = unique_id
+        self._service = service
 
     async def async_press(self) -> None:
-        await self.hass.services.async_call(DOMAIN, SERVICE_REFRESH_NOW, {}, blocking=True)
-
-
-class FlightDashboardPruneLandedButton(ButtonEntity):
-    _attr_name = "Flight Dashboard Remove Landed Flights"
-    _attr_unique_id = "flight_status_tracker_remove_landed"
-    _attr_icon = "mdi:airplane-off"
-    _attr_suggested_object_id = "flight_status_tracker_remove_landed"
-
-    def __init__(self, hass: HomeAssistant) -> None:
-        self.hass = hass
-
-    async def async_press(self) -> None:
-        await self.hass.services.async_call(DOMAIN, SERVICE_PRUNE_LANDED, {}, blocking=True)
+        await self.hass.services.async_call(DOMAIN, self._service, {}, blocking=True)
+
+
+# (name, unique_id, icon, service) for the pure service-call buttons.
+_SERVICE_BUTTONS = (
+    (
+        "Flight Dashboard Clear Manual Flights",
+        "flight_status_tracker_clear_manual_flights",
+        "mdi:delete-sweep",
+        SERVICE_CLEAR,
+    ),
+    (
+        "Flight Dashboard Refresh Now",
+        "flight_status_tracker_refresh_now",
+        "mdi:refresh",
+        SERVICE_REFRESH_NOW,
+    ),
+    (
+        "Flight Dashboard Remove Landed Flights",
+        "flight_status_tracker_remove_landed",
+        "mdi:airplane-off",
+        SERVICE_PRUNE_LANDED,
+    ),
+    (
+        "Flight Status Tracker Clear Preview",
+        "flight_status_tracker_clear_preview",
+        "mdi:broom",
+        SERVICE_CLEAR_PREVIEW,
+    ),
+)
 
 
 class FlightDashboardConfirmAddPreviewButton(ButtonEntity):
@@ -163,23 +175,40 @@ class FlightDashboardConfirmAddPreviewButton(ButtonEntity):
             flight["travellers"] = []
 
         try:
-            flight_key = await async_add_manual_flight_record(self.hass, flight)
+            # Shield the storage write so a cancelled press (e.g. HA
+            # shutdown) cannot leave the manual store half-written.
+            flight_key = await asyncio.shield(
+                async_add_manual_flight_record(self.hass, flight)
+            )
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             await _notify(self.hass, "Flight Dashboard — Add failed", str(e))
             return
         added = {"flight_key": flight_key, **flight}
         await async_set_preview(self.hass, None)
 
-        # Trigger rebuild of upcoming flights sensor
+        # Trigger rebuild of upcoming flights sensor and wait for it to
+        # write state instead of polling the attribute list.
+        rebuilt = asyncio.Event()
+
+        # @callback keeps this in the event loop; a bare lambda would run
+        # in an executor thread, where Event.set() is not thread-safe and
+        # the wait below could miss the wakeup.
+        @callback
+        def _on_rebuilt(_event) -> None:
+            rebuilt.set()
+
+        unsub = async_track_state_change_event(self.hass, [UPCOMING_SENSOR], _on_rebuilt)
         self.hass.bus.async_fire(EVENT_UPDATED)
+        try:
+            await asyncio.wait_for(rebuilt.wait(), timeout=2.0)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            unsub()
 
-        # Wait a bit for sensor rebuild
-        visible = False
-        for _ in range(10):  # ~2 seconds
-            await asyncio.sleep(0.2)
-            if flight_key and _is_visible_in_upcoming(self.hass, flight_key):
-                visible = True
-                break
+        visible = bool(flight_key) and _is_visible_in_upcoming(self.hass, flight_key)
 
         if visible:
             await _notify(
@@ -195,7 +224,11 @@ class FlightDashboardConfirmAddPreviewButton(ButtonEntity):
         include_past_hours = _get_include_past_hours(self.hass)
         dep = _parse_iso(added.get("scheduled_departure"))
         if dep:
-            dep_utc = dt_util.as_utc(dep) if dep.tzinfo else dt_util.as_utc(dt_util.as_local(dep))
+            # Naive datetimes are HA-local; attach the zone once and convert
+            # straight to UTC instead of the as_local -> as_utc double hop.
+            if dep.tzinfo is None:
+                dep = dep.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+            dep_utc = dep.astimezone(timezone.utc)
             now = dt_util.utcnow()
             hours_ago = (now - dep_utc).total_seconds() / 3600.0
             if hours_ago > include_past_hours:
@@ -273,19 +306,6 @@ class FlightStatusTrackerPreviewFromInputsButton(ButtonEntity):
         await self.hass.services.async_call(DOMAIN, SERVICE_PREVIEW_FLIGHT, data, blocking=True)
 
 
-class FlightStatusTrackerClearPreviewButton(ButtonEntity):
-    _attr_name = "Flight Status Tracker Clear Preview"
-    _attr_unique_id = "flight_status_tracker_clear_preview"
-    _attr_icon = "mdi:broom"
-    _attr_suggested_object_id = "flight_status_tracker_clear_preview"
-
-    def __init__(self, hass: HomeAssistant) -> None:
-        self.hass = hass
-
-    async def async_press(self) -> None:
-        await self.hass.services.async_call(DOMAIN, SERVICE_CLEAR_PREVIEW, {}, blocking=True)
-
-
 class FlightStatusTrackerImportLegacyFlightsButton(ButtonEntity):
     _attr_name = "Flight Status Tracker Import Legacy Flights (flight_dashboard)"
     _attr_unique_id = "flight_status_tracker_import_legacy_flights"
@@ -310,13 +330,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     async_add_entities(
         [
             FlightDashboardRemoveSelectedFlightButton(hass),
-            FlightDashboardClearManualFlightsButton(hass),
-            FlightDashboardRefreshNowButton(hass),
-            FlightDashboardPruneLandedButton(hass),
+            *(FlightDashboardServiceButton(hass, *spec) for spec in _SERVICE_BUTTONS),
             FlightDashboardConfirmAddPreviewButton(hass),
             FlightDashboardClearAddPreviewButton(hass),
             FlightStatusTrackerPreviewFromInputsButton(hass),
-            FlightStatusTrackerClearPreviewButton(hass),
             FlightStatusTrackerImportLegacyFlightsButton(hass),
         ]
     )
@@ -1,6 +1,8 @@
 """Config flow for Flight Dashboard."""
 from __future__ import annotations
 
+from functools import partial
+
 import voluptuous as vol
 
 from homeassistant import config_entries
@@ -8,13 +10,10 @@ from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_validation as cv, selector
 
-# TripIt imports can remain even if you don't use them right now
-from .providers.tripit.client import test_connection
-from .providers.tripit.oauth import (
-    TripItRequestToken,
-    exchange_for_access_token,
-    get_request_token,
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .providers.tripit.oauth import TripItRequestToken
 
 DOMAIN = "flight_status_tracker"
 
@@ -82,6 +81,101 @@ DEFAULT_DELAY_GRACE_MINUTES = 10
 DEFAULT_FR24_USE_SANDBOX = False
 DEFAULT_FR24_API_VERSION = "v1"
 
+# Selectors are pure functions of constants; build them once at import so
+# each form render/submit only assembles the schema dict with the current
+# defaults instead of re-allocating every selector object.
+_ITINERARY_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            selector.SelectOptionDict(value="manual", label="Manual"),
+            selector.SelectOptionDict(value="tripit", label="TripIt (optional)"),
+        ],
+        multiple=True,
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    )
+)
+_SCHEDULE_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            selector.SelectOptionDict(value="auto", label="Auto (best available)"),
+            selector.SelectOptionDict(value="aviationstack", label="Aviationstack"),
+            selector.SelectOptionDict(value="airlabs", label="AirLabs"),
+            selector.SelectOptionDict(value="flightapi", label="FlightAPI.io"),
+            selector.SelectOptionDict(value="flightradar24", label="Flightradar24"),
+            selector.SelectOptionDict(value="mock", label="Mock"),
+        ],
+        multiple=False,
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    )
+)
+_STATUS_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            selector.SelectOptionDict(value="local", label="Local (no API)"),
+            selector.SelectOptionDict(value="aviationstack", label="Aviationstack"),
+            selector.SelectOptionDict(value="airlabs", label="AirLabs"),
+            selector.SelectOptionDict(value="flightapi", label="FlightAPI.io"),
+            selector.SelectOptionDict(value="opensky", label="OpenSky"),
+            selector.SelectOptionDict(value="flightradar24", label="Flightradar24"),
+            selector.SelectOptionDict(value="mock", label="Mock"),
+        ],
+        multiple=False,
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    )
+)
+_POSITION_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            selector.SelectOptionDict(value="same_as_status", label="Same as status provider"),
+            selector.SelectOptionDict(value="flightradar24", label="Flightradar24"),
+            selector.SelectOptionDict(value="opensky", label="OpenSky"),
+            selector.SelectOptionDict(value="airlabs", label="AirLabs"),
+            selector.SelectOptionDict(value="none", label="Disabled"),
+        ],
+        multiple=False,
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    )
+)
+_DIRECTORY_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            selector.SelectOptionDict(value="auto", label="Auto (best available)"),
+            selector.SelectOptionDict(value="aviationstack", label="Aviationstack"),
+            selector.SelectOptionDict(value="airlabs", label="AirLabs"),
+            selector.SelectOptionDict(value="fr24", label="Flightradar24"),
+            selector.SelectOptionDict(value="airportsdata", label="Airportsdata (CSV)"),
+            selector.SelectOptionDict(value="openflights", label="OpenFlights (airports.dat)"),
+        ],
+        multiple=False,
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    )
+)
+
+_NUMBER_MINUTES = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=1, max=120, step=1, mode=selector.NumberSelectorMode.SLIDER, unit_of_measurement="min")
+)
+_NUMBER_MINUTES_SMALL = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=0, max=60, step=1, mode=selector.NumberSelectorMode.SLIDER, unit_of_measurement="min")
+)
+_NUMBER_HOURS_0_72 = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=0, max=72, step=1, mode=selector.NumberSelectorMode.SLIDER, unit_of_measurement="h")
+)
+_NUMBER_HOURS_1_168 = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=1, max=168, step=1, mode=selector.NumberSelectorMode.SLIDER, unit_of_measurement="h")
+)
+_NUMBER_HOURS_0_48 = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=0, max=48, step=1, mode=selector.NumberSelectorMode.SLIDER, unit_of_measurement="h")
+)
+_NUMBER_DAYS = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=1, max=365, step=1, mode=selector.NumberSelectorMode.SLIDER, unit_of_measurement="days")
+)
+_NUMBER_DAYS_TTL = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=1, max=3650, step=1, mode=selector.NumberSelectorMode.SLIDER, unit_of_measurement="days")
+)
+_NUMBER_FLIGHTS = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=1, max=200, step=1, mode=selector.NumberSelectorMode.SLIDER)
+)
+
 
 class FlightDashboardConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
@@ -182,108 +276,12 @@ class FlightDashboardOptionsFlowHandler(config_entries.OptionsFlow):
         tripit_key = options.get(CONF_TRIPIT_CONSUMER_KEY, "")
         tripit_secret = options.get(CONF_TRIPIT_CONSUMER_SECRET, "")
 
-        itinerary_selector = selector.SelectSelector(
-            selector.SelectSelectorConfig(
-                options=[
-                    selector.SelectOptionDict(value="manual", label="Manual"),
-                    selector.SelectOptionDict(value="tripit", label="TripIt (optional)"),
-                ],
-                multiple=True,
-                mode=selector.SelectSelectorMode.DROPDOWN,
-            )
-        )
-        schedule_selector = selector.SelectSelector(
-            selector.SelectSelectorConfig(
-                options=[
-                    selector.SelectOptionDict(value="auto", label="Auto (best available)"),
-                    selector.SelectOptionDict(value="aviationstack", label="Aviationstack"),
-                    selector.SelectOptionDict(value="airlabs", label="AirLabs"),
-                    selector.SelectOptionDict(value="flightapi", label="FlightAPI.io"),
-                    selector.SelectOptionDict(value="flightradar24", label="Flightradar24"),
-                    selector.SelectOptionDict(value="mock", label="Mock"),
-                ],
-                multiple=False,
-                mode=selector.SelectSelectorMode.DROPDOWN,
-            )
-        )
-        status_selector = selector.SelectSelector(
-            selector.SelectSelectorConfig(
-                options=[
-                    selector.SelectOptionDict(value="local", label="Local (no API)"),
-                    selector.SelectOptionDict(value="aviationstack", label="Aviationstack"),
-                    selector.SelectOptionDict(value="airlabs", label="AirLabs"),
-                    selector.SelectOptionDict(value="flightapi", label="FlightAPI.io"),
-                    selector.SelectOptionDict(value="opensky", label="OpenSky"),
-                    selector.SelectOptionDict(value="flightradar24", label="Flightradar24"),
-                    selector.SelectOptionDict(value="mock", label="Mock"),
-                ],
-                multiple=False,
-                mode=selector.SelectSelectorMode.DROPDOWN,
-            )
-        )
-        position_selector = selector.SelectSelector(
-            selector.SelectSelectorConfig(
-                options=[
-                    selector.SelectOptionDict(value="same_as_status", label="Same as status provider"),
-                    selector.SelectOptionDict(value="flightradar24", label="Flightradar24"),
-                    selector.SelectOptionDict(value="opensky", label="OpenSky"),
-                    selector.SelectOptionDict(value="airlabs", label="AirLabs"),
-                    selector.SelectOptionDict(value="none", label="Disabled"),
-                ],
-                multiple=False,
-                mode=selector.SelectSelectorMode.DROPDOWN,
-            )
-        )
-
-        number_minutes = selector.NumberSelector(
-            selector.NumberSelectorConfig(min=1, max=120, step=1, mode=selector.NumberSelectorMode.SLIDER, unit_of_measurement="min")
-        )
-        number_minutes_small = selector.NumberSelector(
-            selector.NumberSelectorConfig(min=0, max=60, step=1, mode=selector.NumberSelectorMode.SLIDER, unit_of_measurement="min")
-        )
-        number_hours_0_72 = selector.NumberSelector(
-            selector.NumberSelectorConfig(min=0, max=72, step=1, mode=selector.NumberSelectorMode.SLIDER, unit_of_measurement="h")
-        )
-        number_hours_0_168 = selector.NumberSelector(
-            selector.NumberSelectorConfig(min=0, max=168, step=1, mode=selector.NumberSelectorMode.SLIDER, unit_of_measurement="h")
-        )
-        number_hours_1_168 = selector.NumberSelector(
-            selector.NumberSelectorConfig(min=1, max=168, step=1, mode=selector.NumberSelectorMode.SLIDER, unit_of_measurement="h")
-        )
-        number_hours_0_48 = selector.NumberSelector(
-            selector.NumberSelectorConfig(min=0, max=48, step=1, mode=selector.NumberSelectorMode.SLIDER, unit_of_measurement="h")
-        )
-        number_days = selector.NumberSelector(
-            selector.NumberSelectorConfig(min=1, max=365, step=1, mode=selector.NumberSelectorMode.SLIDER, unit_of_measurement="days")
-        )
-        number_days_ttl = selector.NumberSelector(
-            selector.NumberSelectorConfig(min=1, max=3650, step=1, mode=selector.NumberSelectorMode.SLIDER, unit_of_measurement="days")
-        )
-        number_flights = selector.NumberSelector(
-            selector.NumberSelectorConfig(min=1, max=200, step=1, mode=selector.NumberSelectorMode.SLIDER)
-        )
-
-        directory_selector = selector.SelectSelector(
-            selector.SelectSelectorConfig(
-                options=[
-                    selector.SelectOptionDict(value="auto", label="Auto (best available)"),
-                    selector.SelectOptionDict(value="aviationstack", label="Aviationstack"),
-                    selector.SelectOptionDict(value="airlabs", label="AirLabs"),
-                    selector.SelectOptionDict(value="fr24", label="Flightradar24"),
-                    selector.SelectOptionDict(value="airportsdata", label="Airportsdata (CSV)"),
-                    selector.SelectOptionDict(value="openflights", label="OpenFlights (airports.dat)"),
-                ],
-                multiple=False,
-                mode=selector.SelectSelectorMode.DROPDOWN,
-            )
-        )
-
         schema_dict: dict[Any, Any] = {
             # Providers
-            vol.Required(CONF_SCHEDULE_PROVIDER, default=schedule_provider): schedule_selector,
-            vol.Required(CONF_STATUS_PROVIDER, default=status_provider): status_selector,
-            vol.Required(CONF_POSITION_PROVIDER, default=position_provider): position_selector,
-            vol.Required(CONF_ITINERARY_PROVIDERS, default=providers): itinerary_selector,
+            vol.Required(CONF_SCHEDULE_PROVIDER, default=schedule_provider): _SCHEDULE_SELECTOR,
+            vol.Required(CONF_STATUS_PROVIDER, default=status_provider): _STATUS_SELECTOR,
+            vol.Required(CONF_POSITION_PROVIDER, default=position_provider): _POSITION_SELECTOR,
+            vol.Required(CONF_ITINERARY_PROVIDERS, default=providers): _ITINERARY_SELECTOR,
 
             # API keys
             vol.Optional(CONF_FLIGHTAPI_KEY, default=fa_key): str,
@@ -309,10 +307,10 @@ class FlightDashboardOptionsFlowHandler(config_entries.OptionsFlow):
         # Refresh & rate limits
         schema_dict.update(
             {
-                vol.Required(CONF_STATUS_TTL_MINUTES, default=ttl): number_minutes,
-                vol.Required(CONF_DELAY_GRACE_MINUTES, default=grace): number_minutes_small,
-                vol.Required(CONF_INCLUDE_PAST_HOURS, default=include_past): number_hours_0_72,
-                vol.Required(CONF_DAYS_AHEAD, default=days_ahead): number_days,
+                vol.Required(CONF_STATUS_TTL_MINUTES, default=ttl): _NUMBER_MINUTES,
+                vol.Required(CONF_DELAY_GRACE_MINUTES, default=grace): _NUMBER_MINUTES_SMALL,
+                vol.Required(CONF_INCLUDE_PAST_HOURS, default=include_past): _NUMBER_HOURS_0_72,
+                vol.Required(CONF_DAYS_AHEAD, default=days_ahead): _NUMBER_DAYS,
             }
         )
 
@@ -320,8 +318,8 @@ class FlightDashboardOptionsFlowHandler(config_entries.OptionsFlow):
         schema_dict.update(
             {
                 vol.Optional(CONF_CACHE_DIRECTORY, default=cache_dir): bool,
-                vol.Optional(CONF_CACHE_TTL_DAYS, default=cache_ttl_days): number_days_ttl,
-                vol.Optional(CONF_DIRECTORY_SOURCE, default=directory_source): directory_selector,
+                vol.Optional(CONF_CACHE_TTL_DAYS, default=cache_ttl_days): _NUMBER_DAYS_TTL,
+                vol.Optional(CONF_DIRECTORY_SOURCE, default=directory_source): _DIRECTORY_SELECTOR,
                 vol.Optional(CONF_DIRECTORY_AIRLINES_URL, default=directory_airlines_url): str,
             }
         )
@@ -330,15 +328,15 @@ class FlightDashboardOptionsFlowHandler(config_entries.OptionsFlow):
         schema_dict.update(
             {
                 vol.Optional(CONF_AUTO_PRUNE_LANDED, default=auto_prune): bool,
-                vol.Optional(CONF_PRUNE_LANDED_HOURS, default=prune_hours): number_hours_1_168,
+                vol.Optional(CONF_PRUNE_LANDED_HOURS, default=prune_hours): _NUMBER_HOURS_1_168,
             }
         )
 
         # Advanced list behavior
         schema_dict.update(
             {
-                vol.Required(CONF_MAX_FLIGHTS, default=max_flights): number_flights,
-                vol.Required(CONF_MERGE_TOLERANCE_HOURS, default=tolerance): number_hours_0_48,
+                vol.Required(CONF_MAX_FLIGHTS, default=max_flights): _NUMBER_FLIGHTS,
+                vol.Required(CONF_MERGE_TOLERANCE_HOURS, default=tolerance): _NUMBER_HOURS_0_48,
             }
         )
 
@@ -347,7 +345,15 @@ class FlightDashboardOptionsFlowHandler(config_entries.OptionsFlow):
         return self.async_show_form(step_id="init", data_schema=schema)
 
     async def async_step_tripit_verifier(self, user_input=None) -> FlowResult:
-        # unchanged; can keep in place even if you never use TripIt
+        # Imported here so the TripIt OAuth stack only loads for the users
+        # who actually authorize TripIt, keeping it off the config_flow
+        # import path.
+        from .providers.tripit.client import test_connection
+        from .providers.tripit.oauth import (
+            exchange_for_access_token,
+            get_request_token,
+        )
+
         if user_input is not None:
             verifier = user_input[CONF_TRIPIT_VERIFIER].strip()
             key = self._pending_options.get(CONF_TRIPIT_CONSUMER_KEY, "")
@@ -356,17 +362,17 @@ class FlightDashboardOptionsFlowHandler(config_entries.OptionsFlow):
             if not self._tripit_request_token:
                 return self.async_abort(reason="tripit_no_request_token")
 
-            def _exchange():
-                return exchange_for_access_token(
-                    consumer_key=key,
-                    consumer_secret=secret,
-                    request_token=self._tripit_request_token.oauth_token,
-                    request_token_secret=self._tripit_request_token.oauth_token_secret,
-                    verifier=verifier,
-                )
-
             try:
-                access = await self.hass.async_add_executor_job(_exchange)
+                access = await self.hass.async_add_executor_job(
+                    partial(
+                        exchange_for_access_token,
+                        consumer_key=key,
+                        consumer_secret=secret,
+                        request_token=self._tripit_request_token.oauth_token,
+                        request_token_secret=self._tripit_request_token.oauth_token_secret,
+                        verifier=verifier,
+                    )
+                )
             except Exception:
                 return self.async_show_form(
                     step_id="tripit_verifier",
@@ -374,16 +380,16 @@ class FlightDashboardOptionsFlowHandler(config_entries.OptionsFlow):
                     errors={"base": "tripit_access_token_failed"},
                 )
 
-            def _test():
-                test_connection(
-                    consumer_key=key,
-                    consumer_secret=secret,
-                    access_token=access.oauth_token,
-                    access_token_secret=access.oauth_token_secret,
-                )
-
             try:
-                await self.hass.async_add_executor_job(_test)
+                await self.hass.async_add_executor_job(
+                    partial(
+                        test_connection,
+                        consumer_key=key,
+                        consumer_secret=secret,
+                        access_token=access.oauth_token,
+                        access_token_secret=access.oauth_token_secret,
+                    )
+                )
             except Exception:
                 return self.async_show_form(
                     step_id="tripit_verifier",
@@ -402,11 +408,10 @@ class FlightDashboardOptionsFlowHandler(config_entries.OptionsFlow):
         if not key or not secret:
             return self.async_abort(reason="tripit_missing_consumer_keys")
 
-        def _request():
-            return get_request_token(key, secret)
-
         try:
-            self._tripit_request_token = await self.hass.async_add_executor_job(_request)
+            self._tripit_request_token = await self.hass.async_add_executor_job(
+                get_request_token, key, secret
+            )
         except Exception:
             return self.async_show_form(
                 step_id="tripit_verifier",
@@ -18,6 +18,9 @@ SCHEMA_VERSION = 3
 SIGNAL_MANUAL_FLIGHTS_UPDATED = "flight_status_tracker_manual_flights_updated"
 SIGNAL_PREVIEW_UPDATED = "flight_status_tracker_preview_updated"
 SIGNAL_OPTIONS_UPDATED = "flight_status_tracker_options_updated"
+# In-process fan-out of EVENT_UPDATED (bridged once in async_setup_entry so
+# entities don't each pay for a bus listener).
+SIGNAL_UPDATED = "flight_status_tracker_updated_signal"
 
 # --- Events (optional; safe if unused) ---
 EVENT_UPDATED = "flight_status_tracker_updated"
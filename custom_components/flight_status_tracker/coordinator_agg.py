@@ -6,6 +6,7 @@ AttributeError issues when providers return dicts.
 from __future__ import annotations
 
 from datetime import datetime
+from itertools import chain
 from typing import Any
 
 
@@ -20,14 +21,43 @@ def _iso(val: Any) -> str | None:
     return None
 
 
-def flight_key(seg: dict[str, Any]) -> str:
-    """Stable key for merging duplicates across providers."""
+def flight_key(seg: dict[str, Any]) -> str | tuple:
+    """Stable key for merging duplicates across providers.
+
+    Returns the provider-assigned flight_key when present, otherwise a
+    tuple of the identifying fields — cheaper to build and hash than the
+    formatted string the merge loop used to allocate per segment.
+    """
+    key = seg.get("flight_key")
+    if key:
+        return key
+    dep = seg.get("dep") or {}
+    airport = dep.get("airport") or {}
     return (
-        seg.get("flight_key")
-        or f"{seg.get('airline_code','')}-{seg.get('flight_number','')}-{seg.get('dep',{}).get('airport',{}).get('iata','')}-{seg.get('dep',{}).get('scheduled','')}"
+        seg.get("airline_code", ""),
+        seg.get("flight_number", ""),
+        airport.get("iata", ""),
+        dep.get("scheduled", ""),
     )
 
 
+# Shared read-only sentinel so sort keys don't allocate a {} per element.
+_NO_SIDE: dict[str, Any] = {}
+
+
+def _fill(dst: dict[str, Any], src: dict[str, Any]) -> None:
+    """Copy src values into keys that are empty in dst.
+
+    Emptiness is the explicit None/""/[]/{} sentinel set — a plain
+    falsiness check would treat real values like 0 or False (e.g.
+    delay_minutes: 0) as missing and let a lower-priority provider
+    overwrite them.
+    """
+    for k, v in src.items():
+        if dst.get(k) in (None, "", [], {}) and v not in (None, ""):
+            dst[k] = v
+
+
 def merge_segments(segments: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Merge duplicate flights by flight_key.
 
@@ -45,47 +75,32 @@ def merge_segments(segments: list[dict[str, Any]]) -> list[dict[str, Any]]:
             merged[key] = seg
             continue
 
-        # travellers union
-        a = cur.get("travellers") or []
-        b = seg.get("travellers") or []
-        seen = set()
-        out = []
-        for t in a + b:
-            if t and t not in seen:
-                seen.add(t)
-                out.append(t)
-        cur["travellers"] = out
+        # travellers union; chain streams both lists into the C-level dedup
+        # without the a + b intermediate copy
+        cur["travellers"] = [
+            t
+            for t in dict.fromkeys(chain(cur.get("travellers") or (), seg.get("travellers") or ()))
+            if t
+        ]
 
         # shallow merge: fill missing top-level fields
-        for k, v in seg.items():
-            if cur.get(k) in (None, "", [], {}):
-                cur[k] = v
+        _fill(cur, seg)
 
         # merge dep/arr blocks
         for side in ("dep", "arr"):
-            cur.setdefault(side, {})
             seg_side = seg.get(side) or {}
             cur_side = cur.get(side) or {}
 
             # airport identity
-            cur_side.setdefault("airport", {})
-            seg_air = seg_side.get("airport") or {}
             cur_air = cur_side.get("airport") or {}
-
-            for k, v in seg_air.items():
-                if cur_air.get(k) in (None, "", [], {}):
-                    cur_air[k] = v
+            _fill(cur_air, seg_side.get("airport") or {})
             cur_side["airport"] = cur_air
 
-            # timestamps: scheduled/estimated/actual
-            for tkey in ("scheduled", "estimated", "actual"):
-                if cur_side.get(tkey) in (None, "") and seg_side.get(tkey):
-                    cur_side[tkey] = seg_side.get(tkey)
-
-            # terminal/gate
-            for k in ("terminal", "gate"):
-                if cur_side.get(k) in (None, "") and seg_side.get(k):
-                    cur_side[k] = seg_side.get(k)
+            # timestamps and terminal/gate in one pass
+            for k in ("scheduled", "estimated", "actual", "terminal", "gate"):
+                v = seg_side.get(k)
+                if v and not cur_side.get(k):
+                    cur_side[k] = v
 
             cur[side] = cur_side
 
@@ -96,5 +111,5 @@ def merge_segments(segments: list[dict[str, Any]]) -> list[dict[str, Any]]:
 
     # sort by departure scheduled time (string ISO sorts ok if all have offsets; safer parse elsewhere)
     out = list(merged.values())
-    out.sort(key=lambda x: (x.get("dep", {}).get("scheduled") or ""))
+    out.sort(key=lambda x: (x.get("dep") or _NO_SIDE).get("scheduled") or "")
     return out
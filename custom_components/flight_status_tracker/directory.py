@@ -1,7 +1,10 @@
 """Airport/airline directory lookup with optional caching."""
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+import sys
 from datetime import datetime, timezone
 from typing import Any
 
@@ -27,20 +30,142 @@ from .directory_store import (
     async_set_airport,
     async_set_airline,
     is_fresh,
+    async_check_miss,
+    async_record_miss,
     async_load_cache,
     async_save_cache,
     async_is_initialized,
     async_mark_initialized,
 )
+from .const import DOMAIN
 from .rate_limit import is_blocked
 
 _LOGGER = logging.getLogger(__name__)
 
+
+def _airport_providers(hass: HomeAssistant, source: str, keys: dict[str, Any]) -> list:
+    """Provider list for airport lookups, rebuilt only when inputs change.
+
+    Keyed on the source, credentials and current block states; is_blocked
+    stays per-call because rate-limit blocks are time-based.
+    """
+    cache_key = (
+        source,
+        keys["av_key"],
+        keys["al_key"],
+        keys["fr24_active_key"],
+        keys["fr24_use_sandbox"],
+        keys["fr24_version"],
+        is_blocked(hass, "aviationstack"),
+        is_blocked(hass, "airlabs"),
+        is_blocked(hass, "fr24"),
+    )
+    data = hass.data.setdefault(DOMAIN, {})
+    cached = data.get("airport_provider_list")
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
+
+    providers = []
+    if source in ("auto", "aviationstack") and keys["av_key"] and not cache_key[6]:
+        providers.append(_pooled_provider(hass, AviationstackDirectoryProvider, keys["av_key"]))
+    if source in ("auto", "airlabs") and keys["al_key"] and not cache_key[7]:
+        providers.append(_pooled_provider(hass, AirLabsDirectoryProvider, keys["al_key"]))
+    if source in ("auto", "fr24") and keys["fr24_active_key"] and not cache_key[8]:
+        providers.append(
+            _pooled_provider(
+                hass,
+                FR24DirectoryProvider,
+                keys["fr24_active_key"],
+                use_sandbox=keys["fr24_use_sandbox"],
+                api_version=keys["fr24_version"],
+            )
+        )
+    data["airport_provider_list"] = (cache_key, providers)
+    return providers
+
+
+def _airline_providers(hass: HomeAssistant, source: str, keys: dict[str, Any]) -> list:
+    """Provider list for airline lookups; same caching as airports.
+
+    Skips providers the rate-limit module has blocked — calling them
+    anyway pays the HTTP round-trip and a 429 before backing off.
+    """
+    cache_key = (
+        source,
+        keys["av_key"],
+        keys["al_key"],
+        is_blocked(hass, "aviationstack"),
+        is_blocked(hass, "airlabs"),
+    )
+    data = hass.data.setdefault(DOMAIN, {})
+    cached = data.get("airline_provider_list")
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
+
+    providers = []
+    if source in ("auto", "aviationstack") and keys["av_key"] and not cache_key[3]:
+        providers.append(_pooled_provider(hass, AviationstackDirectoryProvider, keys["av_key"]))
+    if source in ("auto", "airlabs") and keys["al_key"] and not cache_key[4]:
+        providers.append(_pooled_provider(hass, AirLabsDirectoryProvider, keys["al_key"]))
+    data["airline_provider_list"] = (cache_key, providers)
+    return providers
+
+
+def _provider_sem(hass: HomeAssistant) -> asyncio.Semaphore:
+    """Bounded concurrency for external directory calls.
+
+    A full refresh can fan out lookups for dozens of codes at once;
+    capping in-flight provider HTTP at 5 avoids tripping upstream rate
+    limits (which would set is_blocked and degrade every later segment).
+    """
+    data = hass.data.setdefault(DOMAIN, {})
+    sem = data.get("directory_provider_sem")
+    if sem is None:
+        sem = data["directory_provider_sem"] = asyncio.Semaphore(5)
+    return sem
+
+
+def _pooled_provider(hass: HomeAssistant, cls, *args: Any, **kwargs: Any):
+    """Reuse one provider instance per (class, credentials) across lookups.
+
+    Providers were re-instantiated on every call; pooling them in
+    hass.data keeps any per-instance state (and future sessions) alive
+    between requests.
+    """
+    pool = hass.data.setdefault(DOMAIN, {}).setdefault("directory_providers", {})
+    key = (cls.__name__, args, tuple(sorted(kwargs.items())))
+    inst = pool.get(key)
+    if inst is None:
+        inst = pool[key] = cls(hass, *args, **kwargs)
+    return inst
+
+def _norm_iata(iata: str | None) -> str:
+    """Normalize an IATA code, skipping allocation when already normalized.
+
+    Sensor rebuilds look codes up once per flight, and the codes almost
+    always arrive already as 2-3 char upper ASCII strings. The result is
+    interned so repeat lookups of the same code share one string object
+    and the in-flight/cache dict probes compare by identity first.
+    """
+    if not iata:
+        return ""
+    if isinstance(iata, str) and len(iata) <= 3 and iata.isascii() and iata.isupper() and iata.isalnum():
+        return sys.intern(iata)
+    return sys.intern(str(iata).strip().upper())
+
+
 def airline_logo_url(iata: str | None) -> str | None:
     """Return a lightweight logo URL for airline IATA code."""
     if not iata:
         return None
-    code = str(iata).strip().upper()
+    return _airline_logo_url(iata)
+
+
+@functools.lru_cache(maxsize=512)
+def _airline_logo_url(iata: str) -> str | None:
+    # Pure function of a short string; dashboards re-request the same
+    # ~20 airlines per render, so cache normalized URL strings.
+    code = _norm_iata(iata)
     if not code:
         return None
     return f"https://pics.avs.io/64/64/{code}.png"
@@ -51,11 +176,67 @@ def _get_option(options: dict[str, Any], key: str, default: Any) -> Any:
     return val if val is not None else default
 
 
+def _nz(options: dict[str, Any], key: str) -> str:
+    """Stripped string option, without the (x or \"\").strip() allocations."""
+    if v := options.get(key):
+        return v.strip() if isinstance(v, str) else str(v).strip()
+    return ""
+
+
 def _directory_source(options: dict[str, Any]) -> str:
     src = str(options.get("directory_source", "auto") or "auto").strip().lower()
     return src
 
 
+# Last resolved provider keys, keyed by the raw option values. Options only
+# change on config update, so lookups hit this instead of re-stripping six
+# strings per call.
+_RESOLVED_KEYS: tuple[tuple, dict[str, Any]] | None = None
+
+
+def _resolved_keys(options: dict[str, Any]) -> dict[str, Any]:
+    """Strip and derive the provider API keys once per options version."""
+    global _RESOLVED_KEYS
+    raw = (
+        options.get("aviationstack_access_key"),
+        options.get("airlabs_api_key"),
+        options.get("fr24_api_key"),
+        options.get("fr24_sandbox_key"),
+        options.get("fr24_use_sandbox"),
+        options.get("fr24_api_version"),
+    )
+    cached = _RESOLVED_KEYS
+    if cached is not None and cached[0] == raw:
+        return cached[1]
+    fr24_key = _nz(options, "fr24_api_key")
+    fr24_sandbox_key = _nz(options, "fr24_sandbox_key")
+    fr24_use_sandbox = bool(raw[4])
+    resolved = {
+        "av_key": _nz(options, "aviationstack_access_key"),
+        "al_key": _nz(options, "airlabs_api_key"),
+        "fr24_key": fr24_key,
+        "fr24_sandbox_key": fr24_sandbox_key,
+        "fr24_use_sandbox": fr24_use_sandbox,
+        "fr24_version": _nz(options, "fr24_api_version") or "v1",
+        "fr24_active_key": fr24_sandbox_key if fr24_use_sandbox and fr24_sandbox_key else fr24_key,
+    }
+    _RESOLVED_KEYS = (raw, resolved)
+    return resolved
+
+
+def _airport_cache_usable(
+    data: dict[str, Any] | None, ttl_days: int, now: datetime | None = None
+) -> bool:
+    """True when a cached airport entry is fresh and complete enough to serve."""
+    return bool(
+        data is not None
+        and is_fresh(data, ttl_days, now)
+        and data.get("name")
+        and data.get("city")
+        and data.get("tz")
+    )
+
+
 def _parse_dt(val: str | None) -> datetime | None:
     if not val:
         return None
@@ -82,7 +263,16 @@ async def _ensure_airportsdata_cache(hass: HomeAssistant, ttl_days: int = 30) ->
         return
 
     now_iso = datetime.now(timezone.utc).isoformat()
-    cache["airports"] = {k: {**v, "fetched_at": now_iso} for k, v in index.items()}
+    # Intern tz names: thousands of airports share a few hundred zones, and
+    # ZoneInfo lookups hash the key string.
+    cache["airports"] = {
+        k: {
+            **v,
+            **({"tz": sys.intern(v["tz"])} if isinstance(v.get("tz"), str) else {}),
+            "fetched_at": now_iso,
+        }
+        for k, v in index.items()
+    }
     meta["airportsdata_fetched_at"] = now_iso
     await async_save_cache(hass, cache)
 
@@ -101,63 +291,90 @@ async def async_refresh_builtin_airports_cache(hass: HomeAssistant, options: dic
     await _ensure_airportsdata_cache(hass, ttl_days=ttl_days)
 
 
+# Concurrent lookups for the same code (hub airports repeat across segments)
+# share one in-flight awaitable instead of re-hitting store and providers.
+_inflight_airports: dict[str, asyncio.Future] = {}
+_inflight_airlines: dict[str, asyncio.Future] = {}
+
+
+async def _coalesced(
+    inflight: dict[str, asyncio.Future], hass: HomeAssistant, iata: str, impl
+) -> dict[str, Any] | None:
+    fut = inflight.get(iata)
+    if fut is not None:
+        return await fut
+    fut = hass.loop.create_future()
+    inflight[iata] = fut
+    try:
+        result = await impl()
+    except BaseException as err:
+        if not fut.done():
+            fut.set_exception(err)
+            fut.exception()  # mark retrieved in case nobody is waiting
+        raise
+    else:
+        if not fut.done():
+            fut.set_result(result)
+        return result
+    finally:
+        inflight.pop(iata, None)
+
+
 async def get_airport(hass: HomeAssistant, options: dict[str, Any], iata: str) -> dict[str, Any] | None:
-    iata = (iata or "").strip().upper()
+    iata = _norm_iata(iata)
     if not iata:
         return None
+    return await _coalesced(
+        _inflight_airports, hass, iata, lambda: _get_airport(hass, options, iata)
+    )
+
 
+async def _get_airport(hass: HomeAssistant, options: dict[str, Any], iata: str) -> dict[str, Any] | None:
     directory_source = _directory_source(options)
     cache_enabled = bool(_get_option(options, "cache_directory", True))
     ttl_days = int(_get_option(options, "cache_ttl_days", 90))
     if directory_source == "airportsdata":
         ttl_days = 30
-    airports_url = OPENFLIGHTS_AIRPORTS_URL if directory_source in ("openflights", "custom") else AIRPORTSDATA_AIRPORTS_URL
-
-    def _is_complete_airport(data: dict[str, Any] | None) -> bool:
-        if not isinstance(data, dict):
-            return False
-        return bool(data.get("name") and data.get("city") and data.get("tz"))
 
     if cache_enabled and directory_source == "airportsdata":
         await _ensure_airportsdata_cache(hass, ttl_days=30)
 
     if cache_enabled:
         cached = await async_get_airport(hass, iata)
-        if is_fresh(cached, ttl_days) and _is_complete_airport(cached):
+        if _airport_cache_usable(cached, ttl_days):
             return cached
-
-    av_key = (options.get("aviationstack_access_key") or "").strip()
-    al_key = (options.get("airlabs_api_key") or "").strip()
-    fr24_key = (options.get("fr24_api_key") or "").strip()
-    fr24_sandbox_key = (options.get("fr24_sandbox_key") or "").strip()
-    fr24_use_sandbox = bool(options.get("fr24_use_sandbox", False))
-    fr24_version = (options.get("fr24_api_version") or "v1").strip()
-    fr24_active_key = fr24_sandbox_key if fr24_use_sandbox and fr24_sandbox_key else fr24_key
-
-    providers = []
-    if directory_source in ("auto", "aviationstack") and av_key and not is_blocked(hass, "aviationstack"):
-        providers.append(AviationstackDirectoryProvider(hass, av_key))
-    if directory_source in ("auto", "airlabs") and al_key and not is_blocked(hass, "airlabs"):
-        providers.append(AirLabsDirectoryProvider(hass, al_key))
-    if directory_source in ("auto", "fr24") and fr24_active_key and not is_blocked(hass, "fr24"):
-        providers.append(FR24DirectoryProvider(hass, fr24_active_key, use_sandbox=fr24_use_sandbox, api_version=fr24_version))
-
-    for p in providers:
-        try:
-            data = await p.async_get_airport(iata)
-        except Exception as e:
-            _LOGGER.debug("Directory provider failed for airport %s: %s", iata, e)
-            data = None
-        if data:
-            merged = {}
-            for k, v in data.items():
-                if v is not None and v != "":
-                    merged[k] = v
-            if cache_enabled:
-                await async_set_airport(hass, iata, merged)
-            return merged
+        # Negative cache: skip the whole provider chain for codes that
+        # recently came up empty everywhere.
+        if await async_check_miss(hass, "airports", iata, ttl_days):
+            return None
+
+    providers = _airport_providers(hass, directory_source, _resolved_keys(options))
+
+    if providers:
+        # Providers are independent; query them concurrently and keep the
+        # first result in priority order (sum-of-latencies -> max).
+        sem = _provider_sem(hass)
+
+        async def _call(p):
+            async with sem:
+                return await p.async_get_airport(iata)
+
+        results = await asyncio.gather(
+            *(_call(p) for p in providers), return_exceptions=True
+        )
+        for data in results:
+            if isinstance(data, BaseException):
+                _LOGGER.debug("Directory provider failed for airport %s: %s", iata, data)
+                continue
+            if data:
+                merged = {k: v for k, v in data.items() if v not in (None, "")}
+                if cache_enabled:
+                    # Persist off the critical path; Store coalesces writes.
+                    hass.async_create_task(async_set_airport(hass, iata, merged))
+                return merged
 
     # Fallback: directory file (airportsdata CSV or OpenFlights .dat)
+    airports_url = OPENFLIGHTS_AIRPORTS_URL if directory_source in ("openflights", "custom") else AIRPORTSDATA_AIRPORTS_URL
     try:
         if directory_source in ("airportsdata", "auto"):
             data = await airportsdata_get_airport(hass, iata, airports_url)
@@ -167,48 +384,60 @@ async def get_airport(hass: HomeAssistant, options: dict[str, Any], iata: str) -
             data = None
         if data:
             if cache_enabled:
-                await async_set_airport(hass, iata, data)
+                hass.async_create_task(async_set_airport(hass, iata, data))
             return data
     except Exception as e:
         _LOGGER.debug("Directory airport fallback failed for %s: %s", iata, e)
 
+    if cache_enabled:
+        await async_record_miss(hass, "airports", iata)
     return None
 
 
 async def get_airline(hass: HomeAssistant, options: dict[str, Any], iata: str) -> dict[str, Any] | None:
-    iata = (iata or "").strip().upper()
+    iata = _norm_iata(iata)
     if not iata:
         return None
+    return await _coalesced(
+        _inflight_airlines, hass, iata, lambda: _get_airline(hass, options, iata)
+    )
+
 
+async def _get_airline(hass: HomeAssistant, options: dict[str, Any], iata: str) -> dict[str, Any] | None:
     cache_enabled = bool(_get_option(options, "cache_directory", True))
     ttl_days = int(_get_option(options, "cache_ttl_days", 90))
-    source = _directory_source(options)
-    airlines_url = str(_get_option(options, "directory_airlines_url", "")).strip() or OPENFLIGHTS_AIRLINES_URL
 
+    # Steady state is ~100% cache hits; don't parse sources/keys until a miss.
     if cache_enabled:
         cached = await async_get_airline(hass, iata)
         if is_fresh(cached, ttl_days):
             return cached
+        if await async_check_miss(hass, "airlines", iata, ttl_days):
+            return None
+
+    source = _directory_source(options)
+    airlines_url = _nz(options, "directory_airlines_url") or OPENFLIGHTS_AIRLINES_URL
 
-    av_key = (options.get("aviationstack_access_key") or "").strip()
-    al_key = (options.get("airlabs_api_key") or "").strip()
+    providers = _airline_providers(hass, source, _resolved_keys(options))
 
-    providers = []
-    if source in ("auto", "aviationstack") and av_key:
-        providers.append(AviationstackDirectoryProvider(hass, av_key))
-    if source in ("auto", "airlabs") and al_key:
-        providers.append(AirLabsDirectoryProvider(hass, al_key))
-
-    for p in providers:
-        try:
-            data = await p.async_get_airline(iata)
-        except Exception as e:
-            _LOGGER.debug("Directory provider failed for airline %s: %s", iata, e)
-            data = None
-        if data:
-            if cache_enabled:
-                await async_set_airline(hass, iata, data)
-            return data
+    if providers:
+        sem = _provider_sem(hass)
+
+        async def _call(p):
+            async with sem:
+                return await p.async_get_airline(iata)
+
+        results = await asyncio.gather(
+            *(_call(p) for p in providers), return_exceptions=True
+        )
+        for data in results:
+            if isinstance(data, BaseException):
+                _LOGGER.debug("Directory provider failed for airline %s: %s", iata, data)
+                continue
+            if data:
+                if cache_enabled:
+                    hass.async_create_task(async_set_airline(hass, iata, data))
+                return data
 
     # Fallback: airlines.dat (OpenFlights or user-provided URL)
     if source == "custom" and not airlines_url:
@@ -220,14 +449,41 @@ async def get_airline(hass: HomeAssistant, options: dict[str, Any], iata: str) -
             data = None
         if data:
             if cache_enabled:
-                await async_set_airline(hass, iata, data)
+                hass.async_create_task(async_set_airline(hass, iata, data))
             return data
     except Exception as e:
         _LOGGER.debug("OpenFlights airline fallback failed for %s: %s", iata, e)
 
+    if cache_enabled:
+        await async_record_miss(hass, "airlines", iata)
     return None
 
 
+async def async_enrich(
+    hass: HomeAssistant,
+    options: dict[str, Any],
+    dep_iata: str | None,
+    arr_iata: str | None,
+    airline_iata: str | None,
+) -> tuple[dict[str, Any] | None, dict[str, Any] | None, dict[str, Any] | None]:
+    """Resolve dep/arr airports and the airline concurrently.
+
+    The three lookups hit disjoint caches and providers, so fanning them
+    out collapses three sequential awaits into one. Empty/None codes and
+    failures yield None for that slot.
+    """
+    results = await asyncio.gather(
+        get_airport(hass, options, dep_iata or ""),
+        get_airport(hass, options, arr_iata or ""),
+        get_airline(hass, options, airline_iata or ""),
+        return_exceptions=True,
+    )
+    dep, arr, airline = (
+        None if isinstance(r, BaseException) else r for r in results
+    )
+    return dep, arr, airline
+
+
 async def warm_directory_cache(hass: HomeAssistant, options: dict[str, Any], flights: list[dict[str, Any]]) -> None:
     """Populate local directory cache on first run using known flights only."""
     cache_enabled = bool(_get_option(options, "cache_directory", True))
@@ -236,30 +492,61 @@ async def warm_directory_cache(hass: HomeAssistant, options: dict[str, Any], fli
     if await async_is_initialized(hass):
         return
 
-    # Collect unique IATA codes from flights
+    # Collect unique, already-normalized IATA codes from flights in one
+    # pass. Bound adds locally and walk dep/arr without allocating the
+    # `or {}` placeholder dicts per flight.
     airport_codes: set[str] = set()
     airline_codes: set[str] = set()
+    ap_add = airport_codes.add
+    al_add = airline_codes.add
     for f in flights:
-        airline = (f.get("airline_code") or "").strip().upper()
-        if airline:
-            airline_codes.add(airline)
-        dep_iata = ((f.get("dep") or {}).get("airport") or {}).get("iata")
-        arr_iata = ((f.get("arr") or {}).get("airport") or {}).get("iata")
-        if dep_iata:
-            airport_codes.add(str(dep_iata).strip().upper())
-        if arr_iata:
-            airport_codes.add(str(arr_iata).strip().upper())
-
-    # Populate cache (calls provider only if not already cached/stale)
-    for code in sorted(airport_codes):
-        try:
-            await get_airport(hass, options, code)
-        except Exception:
-            pass
-    for code in sorted(airline_codes):
-        try:
-            await get_airline(hass, options, code)
-        except Exception:
-            pass
+        if airline := (f.get("airline_code") or "").strip().upper():
+            al_add(airline)
+        for side in ("dep", "arr"):
+            block = f.get(side)
+            if block and (airport := block.get("airport")) and (code := airport.get("iata")):
+                ap_add(str(code).strip().upper())
+
+    # Bulk-prefetch airports when a provider supports multi-code queries
+    # (AirLabs): one request fills the cache for all uncached codes, and
+    # the per-code warms below then resolve from the store. On failure the
+    # per-code path still covers every code.
+    if airport_codes:
+        ttl_days = int(_get_option(options, "cache_ttl_days", 90))
+        providers = _airport_providers(hass, _directory_source(options), _resolved_keys(options))
+        bulk = next((p for p in providers if hasattr(p, "async_get_airports")), None)
+        if bulk:
+            now = datetime.now(timezone.utc)
+            uncached = [
+                code
+                for code in sorted(airport_codes)
+                if not _airport_cache_usable(await async_get_airport(hass, code), ttl_days, now)
+            ]
+            if uncached:
+                try:
+                    found = await bulk.async_get_airports(uncached)
+                except Exception as e:
+                    _LOGGER.debug("Bulk airport prefetch failed: %s", e)
+                    found = {}
+                for code, data in found.items():
+                    await async_set_airport(hass, code, data)
+
+    # Populate cache concurrently (each call hits the provider only if not
+    # already cached/stale). The semaphore keeps the warm-up burst from
+    # opening an unbounded number of provider requests at once.
+    sem = asyncio.Semaphore(8)
+
+    async def _warm(fn, code: str) -> Any:
+        async with sem:
+            return await fn(hass, options, code)
+
+    results = await asyncio.gather(
+        *(_warm(get_airport, code) for code in sorted(airport_codes)),
+        *(_warm(get_airline, code) for code in sorted(airline_codes)),
+        return_exceptions=True,
+    )
+    for res in results:
+        if isinstance(res, BaseException):
+            _LOGGER.debug("Directory warm-up lookup failed: %s", res)
 
     await async_mark_initialized(hass)
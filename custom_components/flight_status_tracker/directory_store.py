@@ -1,4 +1,10 @@
-"""Directory cache storage for airports and airlines."""
+"""Directory cache storage for airports and airlines.
+
+The cache lives in memory (``hass.data[DOMAIN]["directory_cache"]``) and is
+loaded from disk once per HA start. Writes mutate the in-memory dict and are
+flushed through ``Store.async_delay_save`` so a warm-up burst of N codes
+costs one serialization instead of N full-file rewrites.
+"""
 from __future__ import annotations
 
 from datetime import datetime, timezone
@@ -7,9 +13,10 @@ from typing import Any
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.storage import Store
 
-from .const import STORAGE_KEY_DIRECTORY
+from .const import DOMAIN, STORAGE_KEY_DIRECTORY
 
 _STORE_VERSION = 1
+_SAVE_DELAY = 5.0
 
 
 def _utcnow_iso() -> str:
@@ -25,24 +32,32 @@ def _parse_dt(val: str | None) -> datetime | None:
         return None
 
 
-async def _store(hass: HomeAssistant) -> Store:
-    return Store(hass, _STORE_VERSION, STORAGE_KEY_DIRECTORY)
+def _store(hass: HomeAssistant) -> Store:
+    domain = hass.data.setdefault(DOMAIN, {})
+    st = domain.get("directory_store")
+    if st is None:
+        st = domain["directory_store"] = Store(hass, _STORE_VERSION, STORAGE_KEY_DIRECTORY)
+    return st
 
 
 async def async_load_cache(hass: HomeAssistant) -> dict[str, Any]:
-    st = await _store(hass)
-    data = await st.async_load() or {}
+    domain = hass.data.setdefault(DOMAIN, {})
+    cache = domain.get("directory_cache")
+    if cache is not None:
+        return cache
+    data = await _store(hass).async_load() or {}
     if not isinstance(data, dict):
-        return {"airports": {}, "airlines": {}, "meta": {}}
+        data = {}
     data.setdefault("airports", {})
     data.setdefault("airlines", {})
     data.setdefault("meta", {})
+    domain["directory_cache"] = data
     return data
 
 
 async def async_save_cache(hass: HomeAssistant, cache: dict[str, Any]) -> None:
-    st = await _store(hass)
-    await st.async_save(cache)
+    hass.data.setdefault(DOMAIN, {})["directory_cache"] = cache
+    _store(hass).async_delay_save(lambda: cache, _SAVE_DELAY)
 
 
 async def async_get_airport(hass: HomeAssistant, iata: str) -> dict[str, Any] | None:
@@ -59,6 +74,7 @@ async def async_set_airport(hass: HomeAssistant, iata: str, data: dict[str, Any]
     cache = await async_load_cache(hass)
     airports = cache.setdefault("airports", {})
     airports[iata] = {**data, "fetched_at": _utcnow_iso()}
+    _clear_miss(cache, "airports", iata)
     await async_save_cache(hass, cache)
 
 
@@ -72,17 +88,69 @@ async def async_set_airline(hass: HomeAssistant, iata: str, data: dict[str, Any]
         if code:
             logo = f"https://pics.avs.io/64/64/{code}.png"
     airlines[iata] = {**data, "logo_url": logo, "fetched_at": _utcnow_iso()}
+    _clear_miss(cache, "airlines", iata)
     await async_save_cache(hass, cache)
 
 
-def is_fresh(entry: dict[str, Any] | None, ttl_days: int) -> bool:
+# Negative cache: codes every provider recently came up empty for. Without
+# it an unknown code re-queries the full provider chain on every rebuild.
+_MISS_CAP = 256
+
+
+def _clear_miss(cache: dict[str, Any], kind: str, iata: str) -> None:
+    misses = cache.get("misses")
+    if misses and kind in misses:
+        misses[kind].pop(iata, None)
+
+
+async def async_check_miss(hass: HomeAssistant, kind: str, iata: str, ttl_days: int) -> bool:
+    """Return True if iata was recently a confirmed miss for kind."""
+    cache = await async_load_cache(hass)
+    ts = ((cache.get("misses") or {}).get(kind) or {}).get(iata)
+    dt = _parse_dt(ts) if isinstance(ts, str) else None
+    if not dt:
+        return False
+    age = datetime.now(timezone.utc) - dt.astimezone(timezone.utc)
+    # Misses expire faster than hits so a code added to the directory later
+    # is picked up without waiting out the full TTL.
+    return age.total_seconds() <= max(ttl_days / 4, 1) * 86400
+
+
+async def async_record_miss(hass: HomeAssistant, kind: str, iata: str) -> None:
+    cache = await async_load_cache(hass)
+    misses = cache.setdefault("misses", {}).setdefault(kind, {})
+    # Re-insert at the end so dict order doubles as recency for eviction.
+    misses.pop(iata, None)
+    misses[iata] = _utcnow_iso()
+    if len(misses) > _MISS_CAP:
+        for old in list(misses)[: len(misses) - _MISS_CAP]:
+            del misses[old]
+    await async_save_cache(hass, cache)
+
+
+# fetched_at strings are stable for the lifetime of an entry, so the
+# parsed datetime is memoized here instead of being stashed on the entry
+# dict (which gets serialized back to JSON on save).
+_FETCHED_DT: dict[str, datetime | None] = {}
+
+
+def is_fresh(entry: dict[str, Any] | None, ttl_days: int, now: datetime | None = None) -> bool:
     if not entry:
         return False
     fetched_at = entry.get("fetched_at")
-    dt = _parse_dt(fetched_at) if isinstance(fetched_at, str) else None
+    if not isinstance(fetched_at, str):
+        return False
+    if fetched_at in _FETCHED_DT:
+        dt = _FETCHED_DT[fetched_at]
+    else:
+        if len(_FETCHED_DT) > 4096:
+            _FETCHED_DT.clear()
+        dt = _FETCHED_DT[fetched_at] = _parse_dt(fetched_at)
     if not dt:
         return False
-    age = datetime.now(timezone.utc) - dt.astimezone(timezone.utc)
+    if now is None:
+        now = datetime.now(timezone.utc)
+    age = now - dt.astimezone(timezone.utc)
     return age.total_seconds() <= ttl_days * 86400
 
 
@@ -24,7 +24,7 @@ from .const import DOMAIN, SIGNAL_MANUAL_FLIGHTS_UPDATED
 from .status_resolver import _normalize_status_state
 
 _STORE_KEY = f"{DOMAIN}.manual_flights"
-_STORE_VERSION = 1
+_STORE_VERSION = 2
 
 
 def _parse_dt(val: Any) -> datetime | None:
@@ -83,8 +83,50 @@ def _normalize_travellers(travellers: Any) -> list[str]:
     return [str(travellers).strip()]
 
 
-async def _store(hass: HomeAssistant) -> Store:
-    return Store(hass, _STORE_VERSION, _STORE_KEY)
+# Delay before flushing to disk; bursts of upserts (e.g. confirm-add plus
+# enrichment updates) collapse into one serialization. Store flushes any
+# pending delayed save itself on HA shutdown.
+_SAVE_DELAY = 1.0
+
+
+class _ManualStore(Store):
+    """Manual flights store; v2 keys flights by flight_key for O(1) upserts."""
+
+    async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
+        if old_major_version < 2:
+            flights = (old_data or {}).get("flights") or []
+            if isinstance(flights, list):
+                old_data = {
+                    "flights": {
+                        f["flight_key"]: f
+                        for f in flights
+                        if isinstance(f, dict) and f.get("flight_key")
+                    }
+                }
+        return old_data
+
+
+def _store(hass: HomeAssistant) -> Store:
+    domain = hass.data.setdefault(DOMAIN, {})
+    st = domain.get("manual_store")
+    if st is None:
+        st = domain["manual_store"] = _ManualStore(hass, _STORE_VERSION, _STORE_KEY)
+    return st
+
+
+_DELAY_STATUS_MAP = {
+    "on_time": "On Time",
+    "ontime": "On Time",
+    "delayed": "Delayed",
+    "delay": "Delayed",
+    "cancelled": "Cancelled",
+    "canceled": "Cancelled",
+    "arrived": "Arrived",
+    "landed": "Arrived",
+    "unknown": "Unknown",
+    "n/a": "Unknown",
+    "na": "Unknown",
+}
 
 
 def _normalize_delay_status(val: Any) -> str | None:
@@ -94,56 +136,68 @@ def _normalize_delay_status(val: Any) -> str | None:
     if not s:
         return None
     raw = s.lower().replace(" ", "_")
-    if raw in ("on_time", "ontime"):
-        return "On Time"
-    if raw in ("delayed", "delay"):
-        return "Delayed"
-    if raw in ("cancelled", "canceled"):
-        return "Cancelled"
-    if raw in ("arrived", "landed"):
-        return "Arrived"
-    if raw in ("unknown", "n/a", "na"):
-        return "Unknown"
-    return " ".join(w.capitalize() for w in raw.split("_"))
-
+    return _DELAY_STATUS_MAP.get(raw) or " ".join(w.capitalize() for w in raw.split("_"))
+
+
+async def _flights_map(hass: HomeAssistant) -> dict[str, dict[str, Any]]:
+    """Load (once per start) the flights keyed by flight_key."""
+    domain = hass.data.setdefault(DOMAIN, {})
+    cached = domain.get("manual_flights")
+    if cached is not None:
+        return cached
+    data = await _store(hass).async_load() or {}
+    flights = data.get("flights")
+    if not isinstance(flights, dict):
+        flights = {}
+    domain["manual_flights"] = flights
+
+    # One-shot migration: normalize stored status strings to Title Case.
+    # The persisted marker means the scan never runs again once done.
+    if not data.get("migrated_status_v1"):
+        for f in flights.values():
+            if not isinstance(f, dict):
+                continue
+            status_state = f.get("status_state")
+            norm_state = _normalize_status_state(status_state, None)
+            if status_state != norm_state:
+                f["status_state"] = norm_state
 
-async def async_list_manual_flights(hass: HomeAssistant) -> list[dict[str, Any]]:
-    st = await _store(hass)
-    data = await st.async_load() or {}
-    flights = data.get("flights") or []
-    if not isinstance(flights, list):
-        return []
+            delay_status = f.get("delay_status")
+            norm_delay = _normalize_delay_status(delay_status)
+            if norm_delay and delay_status != norm_delay:
+                f["delay_status"] = norm_delay
 
-    # One-time migration: normalize stored status strings to Title Case.
-    changed = False
-    for f in flights:
-        if not isinstance(f, dict):
-            continue
-        status_state = f.get("status_state")
-        norm_state = _normalize_status_state(status_state, None)
-        if status_state != norm_state:
-            f["status_state"] = norm_state
-            changed = True
-
-        delay_status = f.get("delay_status")
-        norm_delay = _normalize_delay_status(delay_status)
-        if norm_delay and delay_status != norm_delay:
-            f["delay_status"] = norm_delay
-            changed = True
-
-    if changed:
-        await st.async_save({"flights": flights})
-        async_dispatcher_send(hass, SIGNAL_MANUAL_FLIGHTS_UPDATED)
+        _save_map(hass, flights)
 
     return flights
 
 
-async def async_save_manual_flights(hass: HomeAssistant, flights: list[dict[str, Any]]) -> None:
-    st = await _store(hass)
-    await st.async_save({"flights": flights})
+def _save_map(hass: HomeAssistant, flights: dict[str, dict[str, Any]]) -> None:
+    # Readers see the new mapping immediately via the in-memory cache; the
+    # disk write is coalesced behind the delay.
+    hass.data.setdefault(DOMAIN, {})["manual_flights"] = flights
+    _store(hass).async_delay_save(
+        lambda: {"flights": flights, "migrated_status_v1": True}, _SAVE_DELAY
+    )
     async_dispatcher_send(hass, SIGNAL_MANUAL_FLIGHTS_UPDATED)
 
 
+async def async_list_manual_flights(hass: HomeAssistant) -> list[dict[str, Any]]:
+    flights = await _flights_map(hass)
+    return list(flights.values())
+
+
+async def async_save_manual_flights(hass: HomeAssistant, flights: list[dict[str, Any]]) -> None:
+    _save_map(
+        hass,
+        {
+            f["flight_key"]: f
+            for f in flights
+            if isinstance(f, dict) and f.get("flight_key")
+        },
+    )
+
+
 async def async_add_manual_flight(
     hass: HomeAssistant,
     *,
@@ -167,7 +221,7 @@ async def async_add_manual_flight(
     arr_airport_city: str | None = None,
     arr_airport_tz: str | None = None,
 ) -> str:
-    flights = await async_list_manual_flights(hass)
+    flights = await _flights_map(hass)
 
     airline_code = str(airline_code).strip().upper()
     flight_number = str(flight_number).strip()
@@ -191,7 +245,7 @@ async def async_add_manual_flight(
     flight_key = _mk_flight_key(airline_code, flight_number, dep_airport, dep_date)
 
     # Upsert behavior
-    existing_idx = next((i for i, f in enumerate(flights) if f.get("flight_key") == flight_key), None)
+    existing = flights.get(flight_key)
 
     rec: dict[str, Any] = {
         "source": "manual",
@@ -216,12 +270,9 @@ async def async_add_manual_flight(
         "notes": notes,
     }
 
-    if existing_idx is None:
-        flights.append(rec)
-    else:
-        flights[existing_idx] = {**flights[existing_idx], **rec}
+    flights[flight_key] = {**existing, **rec} if existing else rec
 
-    await async_save_manual_flights(hass, flights)
+    _save_map(hass, flights)
     return flight_key
 
 
@@ -285,31 +336,25 @@ async def async_update_manual_flight(
     hass: HomeAssistant, flight_key: str, updates: dict[str, Any]
 ) -> bool:
     """Update an existing manual flight with new fields."""
-    flights = await async_list_manual_flights(hass)
-    updated = False
-    for i, f in enumerate(flights):
-        if f.get("flight_key") != flight_key:
-            continue
-        flights[i] = {**f, **updates}
-        updated = True
-        break
-    if updated:
-        await async_save_manual_flights(hass, flights)
-    return updated
+    flights = await _flights_map(hass)
+    f = flights.get(flight_key)
+    if f is None:
+        return False
+    flights[flight_key] = {**f, **updates}
+    _save_map(hass, flights)
+    return True
 
 
 async def async_remove_manual_flight(hass: HomeAssistant, flight_key: str) -> bool:
-    flights = await async_list_manual_flights(hass)
-    before = len(flights)
-    flights = [f for f in flights if f.get("flight_key") != flight_key]
-    if len(flights) == before:
+    flights = await _flights_map(hass)
+    if flights.pop(flight_key, None) is None:
         return False
-    await async_save_manual_flights(hass, flights)
+    _save_map(hass, flights)
     return True
 
 
 async def async_clear_manual_flights(hass: HomeAssistant) -> int:
-    flights = await async_list_manual_flights(hass)
+    flights = await _flights_map(hass)
     n = len(flights)
-    await async_save_manual_flights(hass, [])
+    _save_map(hass, {})
     return n
@@ -1,16 +1,20 @@
 """Preview sensor for 'add manual flight' flow."""
 from __future__ import annotations
 
+import logging
 from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from .preview_store import async_get_preview
 from .const import SIGNAL_PREVIEW_UPDATED
 
+_LOGGER = logging.getLogger(__name__)
+
 
 class FlightDashboardAddPreviewSensor(SensorEntity):
     _attr_name = "Flight Dashboard Add Preview"
@@ -21,11 +25,18 @@ class FlightDashboardAddPreviewSensor(SensorEntity):
         self.entry = entry
         self._preview: dict[str, Any] | None = None
         self._unsub = None
+        self._debouncer: Debouncer | None = None
 
     async def async_added_to_hass(self) -> None:
+        # Preview edits can fire a signal per keystroke; the trailing-edge
+        # debounce collapses a burst into one refresh.
+        self._debouncer = Debouncer(
+            self.hass, _LOGGER, cooldown=0.2, immediate=False, function=self._refresh
+        )
+
         @callback
         def _kick(_event=None) -> None:
-            self.hass.async_create_task(self._refresh())
+            self.hass.async_create_task(self._debouncer.async_call())
 
         self._unsub = async_dispatcher_connect(self.hass, SIGNAL_PREVIEW_UPDATED, _kick)
         await self._refresh()
@@ -34,6 +45,9 @@ class FlightDashboardAddPreviewSensor(SensorEntity):
         if self._unsub:
             self._unsub()
             self._unsub = None
+        if self._debouncer:
+            self._debouncer.async_cancel()
+            self._debouncer = None
 
     async def _refresh(self) -> None:
         self._preview = await async_get_preview(self.hass)
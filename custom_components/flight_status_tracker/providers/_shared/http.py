@@ -0,0 +1,89 @@
+"""Shared aiohttp session and request helpers for API providers."""
+from __future__ import annotations
+
+import asyncio
+import random
+from typing import Any
+
+import aiohttp
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant
+from homeassistant.util.json import json_loads
+
+from ...const import DOMAIN
+
+
+def shared_api_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Return the integration-wide ClientSession with connection pooling.
+
+    HA's default session opens fresh TCP/TLS connections per host under
+    load; this one keeps connections alive between lookups so a warm-up
+    burst against the same API host pays the handshake once. Built
+    directly rather than via async_create_clientsession, which supplies
+    its own connector and rejects ours; closed on HA stop instead.
+    Created lazily and reused for the integration lifetime.
+    """
+    domain = hass.data.setdefault(DOMAIN, {})
+    session = domain.get("api_session")
+    if session is None or session.closed:
+        session = domain["api_session"] = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=8,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+            ),
+        )
+
+        async def _close_session(_event) -> None:
+            await session.close()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _close_session)
+    return session
+
+
+_RETRY_STATUSES = (500, 502, 503, 504)
+
+
+async def get_json_with_backoff(
+    session: aiohttp.ClientSession,
+    url: str,
+    *,
+    params: dict[str, Any] | None = None,
+    timeout: Any = None,
+    max_retries: int = 3,
+    base: float = 0.5,
+    cap: float = 8.0,
+) -> tuple[int, Any, str | None]:
+    """GET url and decode JSON, retrying transient faults with backoff.
+
+    Returns (status, payload, retry_after). Network errors, timeouts and
+    5xx responses are retried with jittered exponential backoff so a
+    blip recovers inside this call instead of surfacing an unknown
+    status until the next coordinator poll. 4xx responses (including
+    429 — the caller honors Retry-After) are returned as-is: they are
+    deterministic and retrying them only burns quota. The last attempt
+    re-raises network errors unchanged.
+    """
+    for attempt in range(max_retries):
+        try:
+            async with session.get(url, params=params, timeout=timeout) as resp:
+                if resp.status in _RETRY_STATUSES and attempt < max_retries - 1:
+                    # Drain so the pooled connection can be reused
+                    await resp.read()
+                else:
+                    retry_after = resp.headers.get("Retry-After")
+                    # Decode from raw bytes with HA's orjson-backed loader;
+                    # resp.json() would re-sniff the charset and use stdlib
+                    # json. Non-JSON bodies map to None, which callers
+                    # already treat as "no data".
+                    try:
+                        payload = json_loads(await resp.read())
+                    except ValueError:
+                        payload = None
+                    return resp.status, payload, retry_after
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if attempt >= max_retries - 1:
+                raise
+        await asyncio.sleep(min(cap, base * (1 << attempt)) * (1.0 + random.random() * 0.5))
+    raise RuntimeError("unreachable")  # pragma: no cover
@@ -0,0 +1,198 @@
+"""In-process TTL cache for provider status responses.
+
+Coordinator ticks re-request the same flight far more often than its
+status actually changes; caching the normalized FlightStatus skips the
+HTTP round trip and JSON parse entirely on repeat lookups. TTLs adapt
+to the flight state: a flight that already landed or was cancelled is
+effectively final, a scheduled flight cannot change state before its
+departure window, and unknown/error envelopes are kept only briefly.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any
+
+from .status_base import FlightStatus
+
+_MAX_ENTRIES = 256
+
+# Terminal states (landed/cancelled) stay long enough to cover the
+# post-flight window where the UI still shows the segment.
+_TTL_TERMINAL = 75 * 60.0
+_TTL_ERROR = 60.0
+_TTL_DEFAULT = 5 * 60.0
+_TTL_SCHEDULED_MAX = 12 * 3600.0
+
+_cache: OrderedDict[str, tuple[float, FlightStatus]] = OrderedDict()
+
+
+def status_cache_key(provider: str, flight: dict[str, Any]) -> str | None:
+    """Build a cache key identifying one flight instance for a provider."""
+    airline = (flight.get("airline_code") or "").strip().upper()
+    number = str(flight.get("flight_number") or "").strip()
+    if not airline or not number:
+        return None
+    sd = flight.get("scheduled_departure") or (flight.get("dep") or {}).get("scheduled")
+    day = sd[:10] if isinstance(sd, str) else ""
+    dep = (flight.get("dep_airport") or "").strip().upper()
+    arr = (flight.get("arr_airport") or "").strip().upper()
+    return f"{provider}|{airline}|{number}|{day}|{dep}|{arr}"
+
+
+def _seconds_until(iso: Any) -> float | None:
+    if not isinstance(iso, str) or not iso:
+        return None
+    try:
+        dt = datetime.fromisoformat(iso.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        # FlightAPI scheduled times are airport-local naive strings;
+        # guessing UTC could overshoot by the airport's offset and cache
+        # a stale status hours past departure. Let callers fall back to
+        # the default TTL instead.
+        return None
+    return (dt - datetime.now(timezone.utc)).total_seconds()
+
+
+def _ttl_for(status: FlightStatus) -> float:
+    details = status.details if isinstance(status.details, dict) else {}
+    if details.get("error"):
+        ra = details.get("retry_after")
+        if isinstance(ra, (int, float)) and ra > 0:
+            return float(ra)
+        return _TTL_ERROR
+    state = (status.state or "unknown").lower()
+    if state in ("landed", "arrived", "cancelled", "canceled", "diverted"):
+        return _TTL_TERMINAL
+    if state in ("active", "en-route", "en route"):
+        # Nothing left to learn after the flight arrives; refresh shortly
+        # past the current estimate.
+        secs = _seconds_until(details.get("arr_estimated") or details.get("arr_scheduled"))
+        if secs is not None and secs > 0:
+            return min(secs + 120, _TTL_TERMINAL)
+        return _TTL_DEFAULT
+    if state == "scheduled":
+        secs = _seconds_until(details.get("dep_scheduled"))
+        if secs is not None and secs > 0:
+            return min(secs, _TTL_SCHEDULED_MAX)
+        return _TTL_DEFAULT
+    if state == "unknown":
+        return _TTL_ERROR
+    return _TTL_DEFAULT
+
+
+def status_cache_get(key: str | None) -> FlightStatus | None:
+    if key is None:
+        return None
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+    expires_at, status = entry
+    if time.monotonic() > expires_at:
+        del _cache[key]
+        return None
+    _cache.move_to_end(key)
+    return status
+
+
+def status_cache_set(key: str | None, status: FlightStatus) -> None:
+    if key is None:
+        return
+    _cache[key] = (time.monotonic() + _ttl_for(status), status)
+    _cache.move_to_end(key)
+    if len(_cache) > _MAX_ENTRIES:
+        _cache.popitem(last=False)
+
+
+# Deterministic failures (bad key, exhausted quota, malformed request)
+# will not fix themselves between coordinator ticks; cache the error
+# envelope so repeat calls return instantly without any HTTP. auth and
+# quota errors apply to the whole api key, bad_request only to the one
+# flight that triggered it.
+_NEG_TTLS = {
+    "auth_error": 10 * 60.0,
+    "quota_exceeded": 24 * 3600.0,
+    "bad_request": 3600.0,
+}
+
+_neg_cache: dict[str, tuple[float, FlightStatus]] = {}
+
+
+def _neg_key(provider: str, api_key: str, err_type: str, flight_key: str | None) -> str:
+    # Hash the key so cache internals never hold it in plain text
+    key_hash = hashlib.blake2s(api_key.encode(), digest_size=8).hexdigest()
+    base = f"{provider}|{key_hash}|{err_type}"
+    return f"{base}|{flight_key}" if err_type == "bad_request" else base
+
+
+def negative_cache_get(
+    provider: str, api_key: str, flight_key: str | None
+) -> FlightStatus | None:
+    now = time.monotonic()
+    for err_type in _NEG_TTLS:
+        key = _neg_key(provider, api_key, err_type, flight_key)
+        entry = _neg_cache.get(key)
+        if entry is None:
+            continue
+        expires_at, status = entry
+        if now > expires_at:
+            del _neg_cache[key]
+            continue
+        return status
+    return None
+
+
+def negative_cache_set(
+    provider: str,
+    api_key: str,
+    err_type: str,
+    flight_key: str | None,
+    status: FlightStatus,
+) -> None:
+    ttl = _NEG_TTLS.get(err_type)
+    if ttl is None:
+        return
+    details = status.details if isinstance(status.details, dict) else {}
+    ra = details.get("retry_after")
+    if err_type == "quota_exceeded" and isinstance(ra, (int, float)) and ra > 0:
+        ttl = float(ra)
+    _neg_cache[_neg_key(provider, api_key, err_type, flight_key)] = (
+        time.monotonic() + ttl,
+        status,
+    )
+
+
+_inflight: dict[str, asyncio.Future] = {}
+
+
+async def coalesce_status(key: str | None, fetch) -> FlightStatus | None:
+    """Share one in-flight fetch among concurrent callers for the same key.
+
+    When several entities request the same flight in the same tick, the
+    first caller runs ``fetch`` and the rest await its result, so N
+    concurrent lookups cost one upstream request. Exceptions propagate
+    to every waiter.
+    """
+    if key is None:
+        return await fetch()
+    fut = _inflight.get(key)
+    if fut is not None:
+        return await fut
+    fut = asyncio.get_running_loop().create_future()
+    _inflight[key] = fut
+    try:
+        result = await fetch()
+    except BaseException as exc:
+        fut.set_exception(exc)
+        fut.exception()  # mark retrieved in case nobody else is waiting
+        raise
+    else:
+        fut.set_result(result)
+        return result
+    finally:
+        _inflight.pop(key, None)
@@ -5,7 +5,9 @@ from typing import Any
 
 from homeassistant.core import HomeAssistant
 import logging
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from ...rate_limit import breaker_open, record_failure, record_success
+from .._shared.http import shared_api_session
 
 
 def _first(*vals):
@@ -15,18 +17,36 @@ def _first(*vals):
     return None
 
 
+def _airport_row(a: dict[str, Any], iata: str) -> dict[str, Any]:
+    return {
+        "iata": a.get("iata_code") or iata,
+        "icao": a.get("icao_code"),
+        "name": _first(a.get("name"), a.get("airport_name")),
+        "city": _first(a.get("city"), a.get("city_name")),
+        "country": _first(a.get("country_code"), a.get("country")),
+        "tz": a.get("timezone"),
+        "lat": a.get("lat"),
+        "lon": a.get("lng"),
+        "source": "airlabs",
+    }
+
+
 class AirLabsDirectoryProvider:
     def __init__(self, hass: HomeAssistant, api_key: str) -> None:
         self.hass = hass
         self.api_key = api_key.strip()
 
     async def _get_json(self, url: str, params: dict[str, Any]) -> dict[str, Any] | None:
-        session = async_get_clientsession(self.hass)
+        if breaker_open(self.hass, "airlabs"):
+            return None
+        session = shared_api_session(self.hass)
         try:
             async with session.get(url, params=params, timeout=25) as resp:
                 payload = await resp.json(content_type=None)
+            record_success(self.hass, "airlabs")
             return payload if isinstance(payload, dict) else None
         except Exception as e:
+            record_failure(self.hass, "airlabs")
             _LOGGER.debug("AirLabs directory request failed: %s", e)
             return None
 
@@ -39,20 +59,32 @@ class AirLabsDirectoryProvider:
             return None
         resp_obj = payload.get("response")
         if isinstance(resp_obj, list) and resp_obj:
-            a = resp_obj[0]
-            return {
-                "iata": a.get("iata_code") or iata.upper(),
-                "icao": a.get("icao_code"),
-                "name": _first(a.get("name"), a.get("airport_name")),
-                "city": _first(a.get("city"), a.get("city_name")),
-                "country": _first(a.get("country_code"), a.get("country")),
-                "tz": a.get("timezone"),
-                "lat": a.get("lat"),
-                "lon": a.get("lng"),
-                "source": "airlabs",
-            }
+            return _airport_row(resp_obj[0], iata.upper())
         return None
 
+    async def async_get_airports(self, iatas: list[str]) -> dict[str, dict[str, Any]]:
+        """Fetch several airports in one request.
+
+        AirLabs accepts comma-separated iata_code values, so a warm-up of
+        M codes costs one round-trip instead of M. Returns a dict keyed by
+        IATA; codes the API does not know are simply absent.
+        """
+        codes = [c for c in dict.fromkeys(str(i).strip().upper() for i in iatas) if c]
+        if not codes:
+            return {}
+        url = "https://airlabs.co/api/v9/airports"
+        payload = await self._get_json(url, {"api_key": self.api_key, "iata_code": ",".join(codes)})
+        if not payload or payload.get("error"):
+            return {}
+        resp_obj = payload.get("response")
+        out: dict[str, dict[str, Any]] = {}
+        if isinstance(resp_obj, list):
+            for a in resp_obj:
+                code = str(a.get("iata_code") or "").upper()
+                if code:
+                    out[code] = _airport_row(a, code)
+        return out
+
     async def async_get_airline(self, iata: str) -> dict[str, Any] | None:
         url = "https://airlabs.co/api/v9/airlines"
         payload = await self._get_json(url, {"api_key": self.api_key, "iata_code": iata.upper()})
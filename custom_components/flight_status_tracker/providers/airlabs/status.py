@@ -1,51 +1,63 @@
 """AirLabs status provider."""
 from __future__ import annotations
 
-from datetime import datetime
 from typing import Any
 
+import aiohttp
+
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
+from ...rate_limit import breaker_open, record_failure, record_success
+from .._shared.http import shared_api_session
 from .._shared.status_base import FlightStatus
 
+# Fail fast on unhealthy paths: a stuck DNS/TCP handshake should not hold
+# the status refresh for the old 25 s total.
+_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=5, sock_connect=5, sock_read=10)
+
+
+# Known AirLabs error codes map straight to an error type; messages are
+# only scanned when the code is absent or unrecognized.
+_ERR_CODE_MAP = {
+    "minute_limit_exceeded": "rate_limited",
+    "hour_limit_exceeded": "rate_limited",
+    "month_limit_exceeded": "quota_exceeded",
+    "unknown_api_key": "auth_error",
+    "expired_api_key": "auth_error",
+    "wrong_params": "bad_request",
+    "unknown_method": "bad_request",
+    "not_found": "no_match",
+}
+
+_ERR_SUBSTRINGS = (
+    ("rate", "rate_limited"),
+    ("limit", "rate_limited"),
+    ("quota", "quota_exceeded"),
+    ("api key", "auth_error"),
+)
+
+_RETRY_AFTER_MAP = {
+    "minute_limit_exceeded": 60,
+    "hour_limit_exceeded": 60 * 60,
+    "month_limit_exceeded": 24 * 60 * 60,
+}
+
 
 def _retry_after_from_code(code: str) -> int | None:
-    if code == "minute_limit_exceeded":
-        return 60
-    if code == "hour_limit_exceeded":
-        return 60 * 60
-    if code == "month_limit_exceeded":
-        return 24 * 60 * 60
-    return None
+    return _RETRY_AFTER_MAP.get(code)
 
 
 def _error_type(code: str, message: str) -> str:
-    code_l = (code or "").lower()
+    err_type = _ERR_CODE_MAP.get((code or "").lower())
+    if err_type:
+        return err_type
     msg_l = (message or "").lower()
-    if code_l in {"minute_limit_exceeded", "hour_limit_exceeded"} or "rate" in msg_l or "limit" in msg_l:
-        return "rate_limited"
-    if code_l in {"month_limit_exceeded"} or "quota" in msg_l:
-        return "quota_exceeded"
-    if code_l in {"unknown_api_key", "expired_api_key"} or "api key" in msg_l:
-        return "auth_error"
-    if code_l in {"wrong_params", "unknown_method"}:
-        return "bad_request"
-    if code_l == "not_found":
-        return "no_match"
+    for substr, err_type in _ERR_SUBSTRINGS:
+        if substr in msg_l:
+            return err_type
     return "provider_error"
 
 
-def _iso(s: str | None) -> str | None:
-    if not s:
-        return None
-    try:
-        datetime.fromisoformat(s.replace("Z", "+00:00"))
-        return s
-    except Exception:
-        return s
-
-
 class AirLabsStatusProvider:
     def __init__(self, hass: HomeAssistant, api_key: str) -> None:
         self.hass = hass
@@ -62,10 +74,17 @@ class AirLabsStatusProvider:
         url = "https://airlabs.co/api/v9/flight"
         params = {"api_key": self.api_key, "flight_iata": flight_iata}
 
-        session = async_get_clientsession(self.hass)
-        async with session.get(url, params=params, timeout=25) as resp:
-            payload = await resp.json(content_type=None)
-            retry_after = resp.headers.get("Retry-After")
+        if breaker_open(self.hass, "airlabs"):
+            return None
+        session = shared_api_session(self.hass)
+        try:
+            async with session.get(url, params=params, timeout=_TIMEOUT) as resp:
+                payload = await resp.json(content_type=None)
+                retry_after = resp.headers.get("Retry-After")
+        except Exception:
+            record_failure(self.hass, "airlabs")
+            return None
+        record_success(self.hass, "airlabs")
 
         if isinstance(payload, dict) and payload.get("error"):
             err = payload.get("error")
@@ -115,25 +134,31 @@ class AirLabsStatusProvider:
         arr_est = resp_obj.get("arr_estimated_utc") or resp_obj.get("arr_estimated")
         arr_act = resp_obj.get("arr_actual_utc") or resp_obj.get("arr_actual")
 
-        details = {
-            "provider": "airlabs",
-            "state": status,
-            "dep_scheduled": _iso(dep_sched),
-            "dep_estimated": _iso(dep_est),
-            "dep_actual": _iso(dep_act),
-            "arr_scheduled": _iso(arr_sched),
-            "arr_estimated": _iso(arr_est),
-            "arr_actual": _iso(arr_act),
-            "dep_iata": resp_obj.get("dep_iata") or resp_obj.get("departure_iata"),
-            "arr_iata": resp_obj.get("arr_iata") or resp_obj.get("arrival_iata"),
-            "airline_name": resp_obj.get("airline_name"),
-            "terminal_dep": resp_obj.get("dep_terminal"),
-            "gate_dep": resp_obj.get("dep_gate"),
-            "terminal_arr": resp_obj.get("arr_terminal"),
-            "gate_arr": resp_obj.get("arr_gate"),
-            "delay_minutes": resp_obj.get("delay"),
+        details: dict[str, Any] = {"provider": "airlabs", "state": status}
+        # Only carry fields that are actually present; partial responses
+        # are common and the None padding just bloats stored/serialized
+        # state. Timestamps pass through as-is — downstream parsing
+        # already tolerates malformed values.
+        for key, val in (
+            ("dep_scheduled", dep_sched or None),
+            ("dep_estimated", dep_est or None),
+            ("dep_actual", dep_act or None),
+            ("arr_scheduled", arr_sched or None),
+            ("arr_estimated", arr_est or None),
+            ("arr_actual", arr_act or None),
+            ("dep_iata", resp_obj.get("dep_iata") or resp_obj.get("departure_iata")),
+            ("arr_iata", resp_obj.get("arr_iata") or resp_obj.get("arrival_iata")),
+            ("airline_name", resp_obj.get("airline_name")),
+            ("terminal_dep", resp_obj.get("dep_terminal")),
+            ("gate_dep", resp_obj.get("dep_gate")),
+            ("terminal_arr", resp_obj.get("arr_terminal")),
+            ("gate_arr", resp_obj.get("arr_gate")),
+            # 0 is a real value here; only drop actual nulls
+            ("delay_minutes", resp_obj.get("delay")),
             # useful for OpenSky enrichment sometimes
-            "icao24": (resp_obj.get("hex") or resp_obj.get("icao24") or "").lower().strip() or None,
-        }
+            ("icao24", (resp_obj.get("hex") or resp_obj.get("icao24") or "").lower().strip() or None),
+        ):
+            if val is not None:
+                details[key] = val
 
         return FlightStatus(provider="airlabs", state=status, details=details)
@@ -5,14 +5,50 @@ from typing import Any
 
 from homeassistant.core import HomeAssistant
 import logging
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
+import time
+from collections import OrderedDict
 
-def _first(*vals):
-    for v in vals:
-        if isinstance(v, str) and v.strip():
-            return v.strip()
-    return None
+import aiohttp
+
+from ...rate_limit import breaker_open, record_failure, record_success
+from .._shared.http import shared_api_session
+
+# In-process TTL+LRU memo so repeat lookups (e.g. with the directory
+# cache disabled) skip the network; metadata is effectively immutable
+# over a day. Misses are kept briefly so a burst of lookups for an
+# unknown code costs one request.
+_MAX_ENTRIES = 512
+_HIT_TTL = 86400.0
+_MISS_TTL = 300.0
+
+
+def _memo_get(memo: OrderedDict, code: str) -> tuple[bool, dict[str, Any] | None]:
+    entry = memo.get(code)
+    if entry is None:
+        return False, None
+    ts, value = entry
+    ttl = _HIT_TTL if value is not None else _MISS_TTL
+    if time.monotonic() - ts > ttl:
+        del memo[code]
+        return False, None
+    memo.move_to_end(code)
+    return True, value
+
+
+def _memo_set(memo: OrderedDict, code: str, value: dict[str, Any] | None) -> None:
+    memo[code] = (time.monotonic(), value)
+    memo.move_to_end(code)
+    if len(memo) > _MAX_ENTRIES:
+        memo.popitem(last=False)
+
+
+_airport_memo: OrderedDict[str, tuple[float, dict[str, Any] | None]] = OrderedDict()
+_airline_memo: OrderedDict[str, tuple[float, dict[str, Any] | None]] = OrderedDict()
+
+# A dead endpoint should cost seconds, not 25s per base URL; the circuit
+# breaker takes over after repeated failures.
+_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=5)
 
 
 class AviationstackDirectoryProvider:
@@ -21,19 +57,35 @@ class AviationstackDirectoryProvider:
         self.access_key = access_key.strip()
 
     async def _get_json(self, url: str, params: dict[str, Any]) -> dict[str, Any] | None:
-        session = async_get_clientsession(self.hass)
+        if breaker_open(self.hass, "aviationstack"):
+            return None
+        session = shared_api_session(self.hass)
         try:
-            async with session.get(url, params=params, timeout=25) as resp:
+            async with session.get(url, params=params, timeout=_TIMEOUT) as resp:
                 payload = await resp.json(content_type=None)
+            record_success(self.hass, "aviationstack")
             return payload if isinstance(payload, dict) else None
         except Exception as e:
+            record_failure(self.hass, "aviationstack")
             _LOGGER.debug("Aviationstack directory request failed: %s", e)
             return None
 
     async def async_get_airport(self, iata: str) -> dict[str, Any] | None:
+        code = iata.upper()
+        hit, value = _memo_get(_airport_memo, code)
+        if hit:
+            return value
+        result = await self._fetch_airport(code)
+        _memo_set(_airport_memo, code, result)
+        return result
+
+    async def _fetch_airport(self, iata: str) -> dict[str, Any] | None:
+        # HTTPS first: free plans get a fast https_access_restricted error
+        # payload and fall through to plain HTTP; paid keys never go over
+        # plaintext.
         base_urls = [
-            "http://api.aviationstack.com/v1/airports",
             "https://api.aviationstack.com/v1/airports",
+            "http://api.aviationstack.com/v1/airports",
         ]
         for url in base_urls:
             payload = await self._get_json(
@@ -46,9 +98,11 @@ class AviationstackDirectoryProvider:
             data = payload.get("data")
             if isinstance(data, list) and data:
                 a = data[0]
-                city = _first(a.get("city"), a.get("city_name"))
-                name = _first(a.get("airport_name"), a.get("name"))
-                country = _first(a.get("country_name"), a.get("country"))
+                # Inlined or-chains; the JSON values are strings or None, so
+                # no type guard is needed.
+                city = (a.get("city") or "").strip() or (a.get("city_name") or "").strip() or None
+                name = (a.get("airport_name") or "").strip() or (a.get("name") or "").strip() or None
+                country = (a.get("country_name") or "").strip() or (a.get("country") or "").strip() or None
                 return {
                     "iata": a.get("iata_code") or iata.upper(),
                     "icao": a.get("icao_code"),
@@ -63,9 +117,19 @@ class AviationstackDirectoryProvider:
         return None
 
     async def async_get_airline(self, iata: str) -> dict[str, Any] | None:
+        code = iata.upper()
+        hit, value = _memo_get(_airline_memo, code)
+        if hit:
+            return value
+        result = await self._fetch_airline(code)
+        _memo_set(_airline_memo, code, result)
+        return result
+
+    async def _fetch_airline(self, iata: str) -> dict[str, Any] | None:
+        # HTTPS first; see _fetch_airport.
         base_urls = [
-            "http://api.aviationstack.com/v1/airlines",
             "https://api.aviationstack.com/v1/airlines",
+            "http://api.aviationstack.com/v1/airlines",
         ]
         for url in base_urls:
             payload = await self._get_json(
@@ -81,8 +145,12 @@ class AviationstackDirectoryProvider:
                 return {
                     "iata": al.get("iata_code") or iata.upper(),
                     "icao": al.get("icao_code"),
-                    "name": _first(al.get("airline_name"), al.get("name")),
-                    "country": _first(al.get("country_name"), al.get("country")),
+                    "name": (al.get("airline_name") or "").strip()
+                    or (al.get("name") or "").strip()
+                    or None,
+                    "country": (al.get("country_name") or "").strip()
+                    or (al.get("country") or "").strip()
+                    or None,
                     "callsign": al.get("callsign"),
                     "logo": al.get("logo") or al.get("logo_url"),
                     "source": "aviationstack",
@@ -1,13 +1,21 @@
 """Aviationstack status provider."""
 from __future__ import annotations
 
-from datetime import datetime
+from functools import partial
 from typing import Any
 
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
+from .._shared.http import get_json_with_backoff, shared_api_session
 from .._shared.status_base import FlightStatus
+from .._shared.status_cache import (
+    coalesce_status,
+    negative_cache_get,
+    negative_cache_set,
+    status_cache_get,
+    status_cache_key,
+    status_cache_set,
+)
 
 
 def _error_type(code: str, message: str) -> str:
@@ -26,15 +34,14 @@ def _error_type(code: str, message: str) -> str:
     return "provider_error"
 
 
-def _parse_dt(s: str | None) -> str | None:
-    if not s:
-        return None
-    try:
-        # Keep ISO string; HA UI will format later if needed
-        datetime.fromisoformat(s.replace("Z", "+00:00"))
-        return s
-    except Exception:
-        return s
+# Working (base_url, include_flight_date) combo per access key. Plans
+# differ in HTTP/HTTPS access and flight_date support but are stable for
+# the key's lifetime, so remember what worked and skip the fan-out.
+# Module-level because provider instances are built per lookup.
+_winning_combo: dict[str, tuple[str, bool]] = {}
+
+# Shared read-only stand-in for missing payload sections; never mutate.
+_EMPTY: dict[str, Any] = {}
 
 
 class AviationstackStatusProvider:
@@ -44,6 +51,12 @@ class AviationstackStatusProvider:
 
     async def async_get_status(self, flight: dict[str, Any]) -> FlightStatus | None:
         """Fetch flight status from Aviationstack and normalize fields."""
+        return await coalesce_status(
+            status_cache_key("aviationstack", flight),
+            partial(self._async_fetch_status, flight),
+        )
+
+    async def _async_fetch_status(self, flight: dict[str, Any]) -> FlightStatus | None:
         airline = (flight.get("airline_code") or "").strip()
         number = str(flight.get("flight_number") or "").strip()
         if not airline or not number:
@@ -51,6 +64,13 @@ class AviationstackStatusProvider:
 
         flight_iata = f"{airline}{number}"
 
+        cache_key = status_cache_key("aviationstack", flight)
+        cached = status_cache_get(cache_key) or negative_cache_get(
+            "aviationstack", self.access_key, cache_key
+        )
+        if cached is not None:
+            return cached
+
         # IMPORTANT: free plans often require HTTP; we try http first then https
         base_urls = [
             "http://api.aviationstack.com/v1/flights",
@@ -69,15 +89,26 @@ class AviationstackStatusProvider:
         if flight_date:
             query_variants.insert(0, {"flight_iata": flight_iata, "flight_date": flight_date, "limit": 10})
 
-        session = async_get_clientsession(self.hass)
+        combo = _winning_combo.get(self.access_key)
+        if combo:
+            combo_url, with_date = combo
+            base_urls = [combo_url]
+            query_variants = [
+                next(
+                    (v for v in query_variants if ("flight_date" in v) == with_date),
+                    query_variants[0],
+                )
+            ]
+
+        session = shared_api_session(self.hass)
 
         last_error = None
         for url in base_urls:
             for params_extra in query_variants:
                 params = {"access_key": self.access_key, **params_extra}
-                async with session.get(url, params=params, timeout=25) as resp:
-                    payload = await resp.json(content_type=None)
-                    retry_after = resp.headers.get("Retry-After")
+                status_code, payload, retry_after = await get_json_with_backoff(
+                    session, url, params=params, timeout=25
+                )
 
                 if isinstance(payload, dict) and "error" in payload:
                     last_error = payload.get("error")
@@ -101,8 +132,17 @@ class AviationstackStatusProvider:
                         details["retry_after"] = 60
                     elif err_type == "quota_exceeded":
                         details["retry_after"] = 24 * 60 * 60
-                    return FlightStatus(provider="aviationstack", state="unknown", details=details)
-                if resp.status in (429, 402):
+                    result = FlightStatus(provider="aviationstack", state="unknown", details=details)
+                    negative_cache_set(
+                        "aviationstack", self.access_key, err_type, cache_key, result
+                    )
+                    # Any error payload means the pinned combo may no longer
+                    # fit the plan (e.g. https_access_restricted after a
+                    # downgrade); drop it so the next lookup re-explores the
+                    # full fan-out instead of repeating this error forever.
+                    _winning_combo.pop(self.access_key, None)
+                    return result
+                if status_code in (429, 402):
                     details = {"provider": "aviationstack", "state": "unknown", "error": "rate_limited"}
                     if retry_after and retry_after.isdigit():
                         details["retry_after"] = int(retry_after)
@@ -116,16 +156,22 @@ class AviationstackStatusProvider:
                 # Pick best match by dep/arr airport when available.
                 dep_airport = (flight.get("dep_airport") or "").strip().upper()
                 arr_airport = (flight.get("arr_airport") or "").strip().upper()
-
-                best = None
-                for it in data:
-                    dep = (it.get("departure") or {}).get("iata")
-                    arr = (it.get("arrival") or {}).get("iata")
-                    if dep_airport and arr_airport and dep == dep_airport and arr == arr_airport:
-                        best = it
-                        break
-                if best is None:
-                    best = data[0]
+                want = (dep_airport, arr_airport) if dep_airport and arr_airport else None
+
+                best = data[0]
+                if want:
+                    best = next(
+                        (
+                            it
+                            for it in data
+                            if (
+                                (it.get("departure") or _EMPTY).get("iata"),
+                                (it.get("arrival") or _EMPTY).get("iata"),
+                            )
+                            == want
+                        ),
+                        data[0],
+                    )
 
                 fs = (best.get("flight_status") or "unknown").lower()
                 state = fs if fs else "unknown"
@@ -137,12 +183,14 @@ class AviationstackStatusProvider:
                 details = {
                     "provider": "aviationstack",
                     "state": state,
-                    "dep_scheduled": _parse_dt(dep.get("scheduled")),
-                    "dep_estimated": _parse_dt(dep.get("estimated")),
-                    "dep_actual": _parse_dt(dep.get("actual")),
-                    "arr_scheduled": _parse_dt(arr.get("scheduled")),
-                    "arr_estimated": _parse_dt(arr.get("estimated")),
-                    "arr_actual": _parse_dt(arr.get("actual")),
+                    # ISO strings pass through as-is; HA formats later and
+                    # downstream parsing tolerates malformed values.
+                    "dep_scheduled": dep.get("scheduled") or None,
+                    "dep_estimated": dep.get("estimated") or None,
+                    "dep_actual": dep.get("actual") or None,
+                    "arr_scheduled": arr.get("scheduled") or None,
+                    "arr_estimated": arr.get("estimated") or None,
+                    "arr_actual": arr.get("actual") or None,
                     "dep_iata": dep.get("iata"),
                     "arr_iata": arr.get("iata"),
                     "airline_name": airline_name,
@@ -153,7 +201,15 @@ class AviationstackStatusProvider:
                     "delay_minutes": dep.get("delay") or arr.get("delay"),
                 }
 
-                return FlightStatus(provider="aviationstack", state=state, details=details)
+                _winning_combo[self.access_key] = (url, "flight_date" in params_extra)
+                result = FlightStatus(provider="aviationstack", state=state, details=details)
+                status_cache_set(cache_key, result)
+                return result
+
+        # No match with a pinned combo: drop the pin so the next lookup
+        # re-explores the full fan-out rather than staying narrowed.
+        if combo:
+            _winning_combo.pop(self.access_key, None)
 
         # No match. If API error existed, surface it as unknown status.
         if last_error:
@@ -6,6 +6,7 @@ Endpoint used: GET /airline/{apiKey}?num=XX&date=YYYYMMDD&name=YY
 from __future__ import annotations
 
 from datetime import date, datetime, timezone
+from functools import lru_cache, partial
 from zoneinfo import ZoneInfo
 from typing import Any
 import asyncio
@@ -16,10 +17,22 @@ import aiohttp
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
+from .._shared.http import get_json_with_backoff
 from .._shared.status_base import FlightStatus
+from .._shared.status_cache import (
+    coalesce_status,
+    negative_cache_get,
+    negative_cache_set,
+    status_cache_get,
+    status_cache_key,
+    status_cache_set,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared read-only stand-in for missing payload sections; never mutate.
+_EMPTY: dict[str, Any] = {}
+
 
 def _mask_key(key: str) -> str:
     if not key:
@@ -61,8 +74,11 @@ def _parse_iso(s: str | None) -> datetime | None:
     if not s:
         return None
     try:
-        return datetime.fromisoformat(s.replace("Z", "+00:00"))
-    except Exception:
+        # The C parser accepts a trailing "Z" on Python >= 3.11; no need
+        # for the allocating replace() dance. TypeError covers non-str
+        # payload values, which the API does produce.
+        return datetime.fromisoformat(s)
+    except (TypeError, ValueError):
         return None
 
 
@@ -74,34 +90,49 @@ def _iso(dt: datetime | None) -> str | None:
     return dt.isoformat()
 
 
+_HUMAN_PATTERNS = (
+    "%I:%M %p, %b %d",  # 10:45 PM, Jan 25
+    "%H:%M, %b %d",     # 14:55, Jul 16
+)
+
+
+@lru_cache(maxsize=2048)
+def _strptime_human(raw: str, year: int) -> datetime | None:
+    """Parse a FlightAPI human-readable time, memoized.
+
+    One response triggers up to a dozen of these and the same strings
+    recur across coordinator ticks; strptime rebuilds its format parser
+    every call, so caching by (string, year) skips nearly all of them.
+    """
+    for fmt in _HUMAN_PATTERNS:
+        try:
+            return datetime.strptime(raw, fmt).replace(year=year)
+        except ValueError:
+            continue
+    return None
+
+
 def _parse_human_time(s: str | None, base_date: date | None, tz_hint) -> str | None:
     if not s or not base_date:
         return None
     raw = s.strip()
-    if not raw:
+    # Cheap pre-check: both patterns need at least "H:MM, Mon D"
+    if len(raw) < 10 or "," not in raw:
         return None
-    patterns = (
-        "%I:%M %p, %b %d",  # 10:45 PM, Jan 25
-        "%H:%M, %b %d",     # 14:55, Jul 16
-    )
-    for fmt in patterns:
-        try:
-            dt = datetime.strptime(raw, fmt)
-            dt = dt.replace(year=base_date.year)
-            if tz_hint:
-                dt = dt.replace(tzinfo=tz_hint)
-            return _iso(dt)
-        except Exception:
-            continue
-    return None
+    dt = _strptime_human(raw, base_date.year)
+    if dt is None:
+        return None
+    if tz_hint:
+        dt = dt.replace(tzinfo=tz_hint)
+    return _iso(dt)
 
 
 def _local_date_from_sched(sched: str | None, tzname: str | None) -> date | None:
     if not sched:
         return None
     try:
-        dt = datetime.fromisoformat(sched.replace("Z", "+00:00"))
-    except Exception:
+        dt = datetime.fromisoformat(sched)
+    except (TypeError, ValueError):
         return None
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
@@ -118,20 +149,12 @@ def _parse_human_time_naive(s: str | None, base_date: date | None) -> str | None
     if not s or not base_date:
         return None
     raw = s.strip()
-    if not raw:
+    if len(raw) < 10 or "," not in raw:
         return None
-    patterns = (
-        "%I:%M %p, %b %d",
-        "%H:%M, %b %d",
-    )
-    for fmt in patterns:
-        try:
-            dt = datetime.strptime(raw, fmt)
-            dt = dt.replace(year=base_date.year)
-            return dt.strftime("%Y-%m-%dT%H:%M:%S")
-        except Exception:
-            continue
-    return None
+    dt = _strptime_human(raw, base_date.year)
+    if dt is None:
+        return None
+    return dt.strftime("%Y-%m-%dT%H:%M:%S")
 
 
 def _pick_parts(payload: Any) -> tuple[dict[str, Any] | None, dict[str, Any] | None, dict[str, Any] | None, dict[str, Any] | None]:
@@ -215,6 +238,12 @@ class FlightAPIStatusProvider:
         self.api_key = api_key.strip()
 
     async def async_get_status(self, flight: dict[str, Any]) -> FlightStatus | None:
+        return await coalesce_status(
+            status_cache_key("flightapi", flight),
+            partial(self._async_fetch_status, flight),
+        )
+
+    async def _async_fetch_status(self, flight: dict[str, Any]) -> FlightStatus | None:
         airline = (flight.get("airline_code") or "").strip().upper()
         number = str(flight.get("flight_number") or "").strip()
         if not airline or not number:
@@ -245,16 +274,23 @@ class FlightAPIStatusProvider:
             except Exception:
                 base_date_from_input = None
 
+        cache_key = status_cache_key("flightapi", flight)
+        cached = status_cache_get(cache_key) or negative_cache_get(
+            "flightapi", self.api_key, cache_key
+        )
+        if cached is not None:
+            return cached
+
         url = f"https://api.flightapi.io/airline/{self.api_key}"
         params = {"num": number, "date": yyyymmdd, "name": airline}
 
         session = async_get_clientsession(self.hass)
         _LOGGER.debug("FlightAPI request: %s params=%s key=%s", url, params, _mask_key(self.api_key))
         try:
-            async with session.get(url, params=params, timeout=25) as resp:
-                payload = await resp.json(content_type=None)
-                retry_after = resp.headers.get("Retry-After")
-            _LOGGER.debug("FlightAPI response: status=%s type=%s", resp.status, type(payload).__name__)
+            status_code, payload, retry_after = await get_json_with_backoff(
+                session, url, params=params, timeout=25
+            )
+            _LOGGER.debug("FlightAPI response: status=%s type=%s", status_code, type(payload).__name__)
         except asyncio.TimeoutError:
             _LOGGER.warning("FlightAPI request timed out")
             details = {"provider": "flightapi", "state": "unknown", "error": "timeout"}
@@ -264,12 +300,14 @@ class FlightAPIStatusProvider:
             details = {"provider": "flightapi", "state": "unknown", "error": "network"}
             return FlightStatus(provider="flightapi", state="unknown", details=details)
 
-        if resp.status >= 400:
-            err_type = _error_type(resp.status, payload)
+        if status_code >= 400:
+            err_type = _error_type(status_code, payload)
             details = {"provider": "flightapi", "state": "unknown", "error": err_type}
             if retry_after and retry_after.isdigit():
                 details["retry_after"] = int(retry_after)
-            return FlightStatus(provider="flightapi", state="unknown", details=details)
+            result = FlightStatus(provider="flightapi", state="unknown", details=details)
+            negative_cache_set("flightapi", self.api_key, err_type, cache_key, result)
+            return result
 
         # Some errors are returned in JSON even with 200
         if isinstance(payload, dict) and (payload.get("error") or payload.get("message")):
@@ -280,7 +318,9 @@ class FlightAPIStatusProvider:
                 "error": err_type,
                 "error_message": str(payload.get("error") or payload.get("message")),
             }
-            return FlightStatus(provider="flightapi", state="unknown", details=details)
+            result = FlightStatus(provider="flightapi", state="unknown", details=details)
+            negative_cache_set("flightapi", self.api_key, err_type, cache_key, result)
+            return result
 
         if isinstance(payload, list):
             _LOGGER.debug("FlightAPI response list len=%s", len(payload))
@@ -302,13 +342,17 @@ class FlightAPIStatusProvider:
                     if isinstance(arr, dict):
                         _LOGGER.debug("FlightAPI item[%s].arrival keys=%s", i, sorted(list(arr.keys())))
         dep_obj, arr_obj, aircraft_obj, status_obj = _pick_parts(payload)
+        # Bind once; the dozen-plus field reads below would otherwise
+        # re-evaluate `dep_obj or {}` (allocating a fresh dict) each time.
+        dep_o = dep_obj or _EMPTY
+        arr_o = arr_obj or _EMPTY
 
-        base_dt = _parse_iso((dep_obj or {}).get("departureDateTime"))
+        base_dt = _parse_iso(dep_o.get("departureDateTime"))
         # Use the requested flight date as the canonical base date to avoid
         # mismatches when API returns nearby operating days.
         base_date = base_date_from_input or (base_dt.date() if base_dt else None)
         dep_tz_hint = base_dt.tzinfo if base_dt else None
-        arr_dt_hint = _parse_iso((arr_obj or {}).get("arrivalDateTime"))
+        arr_dt_hint = _parse_iso(arr_o.get("arrivalDateTime"))
         arr_tz_hint = arr_dt_hint.tzinfo if arr_dt_hint else None
 
         # Handle payload with "flights" list (schedule-only format)
@@ -341,14 +385,16 @@ class FlightAPIStatusProvider:
                 "arr_iata": chosen.get("arr_iata"),
                 "airline_name": chosen.get("airline_name"),
             }
-            return FlightStatus(provider="flightapi", state=details["state"], details=details)
+            result = FlightStatus(provider="flightapi", state=details["state"], details=details)
+            status_cache_set(cache_key, result)
+            return result
 
         if not dep_obj and not arr_obj:
             _LOGGER.debug("FlightAPI no matching flight objects for %s%s on %s", airline, number, yyyymmdd)
             return None
 
-        dep_iata = (dep_obj or {}).get("airportCode")
-        arr_iata = (arr_obj or {}).get("airportCode")
+        dep_iata = dep_o.get("airportCode")
+        arr_iata = arr_o.get("airportCode")
         dep_tz_from_airport = None
         arr_tz_from_airport = None
 
@@ -364,12 +410,12 @@ class FlightAPIStatusProvider:
 
         # scheduled/estimated/actual are provided as airport-local times (no trusted tz).
         # Return naive ISO; later normalization uses airport tz.
-        dep_sched = _parse_human_time_naive((dep_obj or {}).get("scheduledTime"), base_date) or _iso(base_dt)
-        arr_sched = _parse_human_time_naive((arr_obj or {}).get("scheduledTime"), base_date) or _iso(arr_dt_hint)
-        dep_est = _parse_human_time_naive((dep_obj or {}).get("estimatedTime"), base_date)
-        arr_est = _parse_human_time_naive((arr_obj or {}).get("estimatedTime"), base_date)
-        dep_act = _parse_human_time_naive((dep_obj or {}).get("offGroundTime") or (dep_obj or {}).get("outGateTime"), base_date)
-        arr_act = _parse_human_time_naive((arr_obj or {}).get("onGroundTime") or (arr_obj or {}).get("inGateTime"), base_date)
+        dep_sched = _parse_human_time_naive(dep_o.get("scheduledTime"), base_date) or _iso(base_dt)
+        arr_sched = _parse_human_time_naive(arr_o.get("scheduledTime"), base_date) or _iso(arr_dt_hint)
+        dep_est = _parse_human_time_naive(dep_o.get("estimatedTime"), base_date)
+        arr_est = _parse_human_time_naive(arr_o.get("estimatedTime"), base_date)
+        dep_act = _parse_human_time_naive(dep_o.get("offGroundTime") or dep_o.get("outGateTime"), base_date)
+        arr_act = _parse_human_time_naive(arr_o.get("onGroundTime") or arr_o.get("inGateTime"), base_date)
 
         # Aircraft type (try a few common keys)
         aircraft_type = None
@@ -392,12 +438,14 @@ class FlightAPIStatusProvider:
             "arr_actual": arr_act,
             "dep_iata": dep_iata,
             "arr_iata": arr_iata,
-            "airline_name": (dep_obj or {}).get("airlineName") or (arr_obj or {}).get("airlineName"),
+            "airline_name": dep_o.get("airlineName") or arr_o.get("airlineName"),
             "aircraft_type": aircraft_type,
-            "terminal_dep": (dep_obj or {}).get("terminal"),
-            "gate_dep": (dep_obj or {}).get("gate"),
-            "terminal_arr": (arr_obj or {}).get("terminal"),
-            "gate_arr": (arr_obj or {}).get("gate"),
+            "terminal_dep": dep_o.get("terminal"),
+            "gate_dep": dep_o.get("gate"),
+            "terminal_arr": arr_o.get("terminal"),
+            "gate_arr": arr_o.get("gate"),
         }
 
-        return FlightStatus(provider="flightapi", state=details["state"], details=details)
+        result = FlightStatus(provider="flightapi", state=details["state"], details=details)
+        status_cache_set(cache_key, result)
+        return result
@@ -13,7 +13,9 @@ from dataclasses import dataclass
 from typing import Any
 
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
+
+from .._shared.http import shared_api_session
 
 
 DEFAULT_BASE_URL = "https://fr24api.flightradar24.com"
@@ -40,18 +42,19 @@ class FR24Client:
     use_sandbox: bool = False
     api_version: str = "v1"
 
-    def _url(self, path: str) -> str:
+    def __post_init__(self) -> None:
+        # Precompute both prefixes; _url runs once per HTTP call.
         base = self.base_url.rstrip("/")
-        p = path if path.startswith("/") else f"/{path}"
+        self._base = base
+        # /api/... is rewritten to /sandbox/api/... when sandbox is enabled
+        self._api_base = base + "/sandbox" if self.use_sandbox else base
 
-        # Rewrite /api/... -> /sandbox/api/... when sandbox enabled
-        if self.use_sandbox and p.startswith("/api/"):
-            p = "/sandbox" + p
-
-        return base + p
+    def _url(self, path: str) -> str:
+        p = path if path.startswith("/") else f"/{path}"
+        return (self._api_base if p.startswith("/api/") else self._base) + p
 
     async def _get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        session = async_get_clientsession(self.hass)
+        session = shared_api_session(self.hass)
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Accept-Version": self.api_version,
@@ -59,7 +62,6 @@ class FR24Client:
         url = self._url(path)
 
         async with session.get(url, headers=headers, params=params, timeout=30) as resp:
-            text = await resp.text()
             if resp.status >= 400:
                 if resp.status in (402, 429):
                     retry_after = None
@@ -67,8 +69,11 @@ class FR24Client:
                     if ra and ra.isdigit():
                         retry_after = int(ra)
                     raise FR24RateLimitError(resp.status, retry_after)
+                text = await resp.text()
                 raise FR24Error(f"HTTP {resp.status}: {text[:300]}")
-            return await resp.json()
+            # Body is only materialized once, straight into the parser;
+            # flight-summary/full payloads can run to megabytes.
+            return await resp.json(loads=json_loads)
 
     async def flight_summary_full(self, **params: Any) -> dict[str, Any]:
         return await self._get("/api/flight-summary/full", params=params)
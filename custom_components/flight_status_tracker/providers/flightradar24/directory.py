@@ -6,7 +6,7 @@ from typing import Any
 from homeassistant.core import HomeAssistant
 
 from .client import FR24Client, FR24Error, FR24RateLimitError
-from ...rate_limit import set_block
+from ...rate_limit import breaker_open, record_failure, record_success, set_block
 
 
 class FR24DirectoryProvider:
@@ -20,16 +20,23 @@ class FR24DirectoryProvider:
         if not iata:
             return None
         code = iata.strip().upper()
+        if breaker_open(self.hass, "fr24"):
+            return None
         client = FR24Client(self.hass, api_key=self.api_key, use_sandbox=self.use_sandbox, api_version=self.api_version)
         try:
             data = await client.airport_full(code)
         except FR24RateLimitError as e:
+            # Rate limits are an upstream decision, not an outage; the block
+            # handles backoff without tripping the breaker.
             set_block(self.hass, "fr24", e.retry_after or 900, "rate_limited")
             return None
         except FR24Error:
+            record_failure(self.hass, "fr24")
             return None
         except Exception:
+            record_failure(self.hass, "fr24")
             return None
+        record_success(self.hass, "fr24")
         if not isinstance(data, dict):
             return None
         tz = None
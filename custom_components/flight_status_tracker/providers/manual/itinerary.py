@@ -25,13 +25,14 @@ def _parse_dt(val: Any) -> datetime | None:
     if isinstance(val, datetime):
         return val
     if isinstance(val, str):
-        dt = dt_util.parse_datetime(val)
-        if dt is not None:
-            return dt
+        # Stored values are canonical ISO-8601; the stdlib C parser
+        # (which accepts a trailing "Z" on Python >= 3.11) handles them
+        # far faster than HA's regex-based parse_datetime, kept only as
+        # the fallback for looser formats.
         try:
-            return datetime.fromisoformat(val.replace("Z", "+00:00"))
-        except Exception:
-            return None
+            return datetime.fromisoformat(val)
+        except ValueError:
+            return dt_util.parse_datetime(val)
     return None
 
 
@@ -43,23 +44,21 @@ def _as_utc_iso(dt: datetime | None) -> str | None:
     return dt_util.as_utc(dt_util.as_local(dt)).isoformat()
 
 
-def _get_nested(raw: dict[str, Any], *path: str) -> Any:
-    cur: Any = raw
-    for p in path:
-        if not isinstance(cur, dict):
-            return None
-        cur = cur.get(p)
-    return None if cur in ("", [], {}) else cur
+# Common airline logo CDN used by many flight apps. A handful of
+# distinct airlines recur across the manual flight list, so memoize the
+# formatted URLs per code.
+_LOGO_TMPL = "https://pics.avs.io/64/64/{}.png"
+_LOGO_CACHE: dict[str, str] = {}
 
 
 def _default_logo_url(airline_code: str | None) -> str | None:
-    if not airline_code:
-        return None
-    code = str(airline_code).strip().upper()
+    code = str(airline_code).strip().upper() if airline_code else ""
     if not code:
         return None
-    # Common airline logo CDN used by many flight apps
-    return f"https://pics.avs.io/64/64/{code}.png"
+    url = _LOGO_CACHE.get(code)
+    if url is None:
+        url = _LOGO_CACHE[code] = _LOGO_TMPL.format(code)
+    return url
 
 
 class ManualItineraryProvider:
@@ -73,47 +72,63 @@ class ManualItineraryProvider:
         out: list[dict[str, Any]] = []
 
         for raw in flights:
-            dep_sched_val = _get_nested(raw, "dep", "scheduled") or raw.get("scheduled_departure")
-            arr_sched_val = _get_nested(raw, "arr", "scheduled") or raw.get("scheduled_arrival")
-
-            dep_sched_dt = _parse_dt(dep_sched_val)
-            arr_sched_dt = _parse_dt(arr_sched_val)
-
-            dep_sched_iso = _as_utc_iso(dep_sched_dt)
-            if not dep_sched_iso:
+            # Window-filter on the departure time alone before touching any
+            # other field; most stored flights fall outside the window and
+            # never pay for the full output dict below.
+            dep = raw.get("dep")
+            dep = dep if isinstance(dep, dict) else {}
+
+            dep_sched_dt = _parse_dt(dep.get("scheduled") or raw.get("scheduled_departure"))
+            if dep_sched_dt is None:
                 continue
 
-            dep_sched_utc = dt_util.parse_datetime(dep_sched_iso)
-            if not dep_sched_utc:
-                continue
+            # Compare datetimes directly; serializing to ISO and re-parsing
+            # just to get a UTC datetime back is pure overhead.
+            if dep_sched_dt.tzinfo:
+                dep_sched_utc = dt_util.as_utc(dep_sched_dt)
+            else:
+                dep_sched_utc = dt_util.as_utc(dt_util.as_local(dep_sched_dt))
 
             if dep_sched_utc < start_utc or dep_sched_utc > end_utc:
                 continue
 
-            dep_iata = _get_nested(raw, "dep", "airport", "iata") or raw.get("dep_airport")
-            arr_iata = _get_nested(raw, "arr", "airport", "iata") or raw.get("arr_airport")
+            dep_sched_iso = dep_sched_utc.isoformat()
+
+            # Hoist the remaining canonical sub-dicts once; every field
+            # below is then a single .get.
+            arr = raw.get("arr")
+            arr = arr if isinstance(arr, dict) else {}
+            dep_air = dep.get("airport")
+            dep_air = dep_air if isinstance(dep_air, dict) else {}
+            arr_air = arr.get("airport")
+            arr_air = arr_air if isinstance(arr_air, dict) else {}
+
+            arr_sched_iso = _as_utc_iso(_parse_dt(arr.get("scheduled") or raw.get("scheduled_arrival")))
+
+            dep_iata = dep_air.get("iata") or raw.get("dep_airport")
+            arr_iata = arr_air.get("iata") or raw.get("arr_airport")
 
-            dep_air_tz = _get_nested(raw, "dep", "airport", "tz") or raw.get("dep_airport_tz")
-            arr_air_tz = _get_nested(raw, "arr", "airport", "tz") or raw.get("arr_airport_tz")
+            dep_air_tz = dep_air.get("tz") or raw.get("dep_airport_tz")
+            arr_air_tz = arr_air.get("tz") or raw.get("arr_airport_tz")
 
-            dep_air_tz_short = _get_nested(raw, "dep", "airport", "tz_short") or raw.get("dep_tz_short")
-            arr_air_tz_short = _get_nested(raw, "arr", "airport", "tz_short") or raw.get("arr_tz_short")
+            dep_air_tz_short = dep_air.get("tz_short") or raw.get("dep_tz_short")
+            arr_air_tz_short = arr_air.get("tz_short") or raw.get("arr_tz_short")
 
-            dep_air_name = _get_nested(raw, "dep", "airport", "name") or raw.get("dep_airport_name")
-            arr_air_name = _get_nested(raw, "arr", "airport", "name") or raw.get("arr_airport_name")
+            dep_air_name = dep_air.get("name") or raw.get("dep_airport_name")
+            arr_air_name = arr_air.get("name") or raw.get("arr_airport_name")
 
-            dep_air_city = _get_nested(raw, "dep", "airport", "city") or raw.get("dep_airport_city")
-            arr_air_city = _get_nested(raw, "arr", "airport", "city") or raw.get("arr_airport_city")
+            dep_air_city = dep_air.get("city") or raw.get("dep_airport_city")
+            arr_air_city = arr_air.get("city") or raw.get("arr_airport_city")
 
-            dep_terminal = _get_nested(raw, "dep", "terminal") or raw.get("terminal_dep")
-            dep_gate = _get_nested(raw, "dep", "gate") or raw.get("gate_dep")
-            arr_terminal = _get_nested(raw, "arr", "terminal") or raw.get("terminal_arr")
-            arr_gate = _get_nested(raw, "arr", "gate") or raw.get("gate_arr")
+            dep_terminal = dep.get("terminal") or raw.get("terminal_dep")
+            dep_gate = dep.get("gate") or raw.get("gate_dep")
+            arr_terminal = arr.get("terminal") or raw.get("terminal_arr")
+            arr_gate = arr.get("gate") or raw.get("gate_arr")
 
-            dep_est = _get_nested(raw, "dep", "estimated") or raw.get("dep_estimated")
-            dep_act = _get_nested(raw, "dep", "actual") or raw.get("dep_actual")
-            arr_est = _get_nested(raw, "arr", "estimated") or raw.get("arr_estimated")
-            arr_act = _get_nested(raw, "arr", "actual") or raw.get("arr_actual")
+            dep_est = dep.get("estimated") or raw.get("dep_estimated")
+            dep_act = dep.get("actual") or raw.get("dep_actual")
+            arr_est = arr.get("estimated") or raw.get("arr_estimated")
+            arr_act = arr.get("actual") or raw.get("arr_actual")
 
             status = raw.get("status") if isinstance(raw.get("status"), dict) else None
 
@@ -135,7 +150,7 @@ class ManualItineraryProvider:
                     "status": status,
                     # expose stored schedule fields so backfill logic doesn't overwrite them
                     "scheduled_departure": dep_sched_iso,
-                    "scheduled_arrival": _as_utc_iso(arr_sched_dt),
+                    "scheduled_arrival": arr_sched_iso,
                     "dep": {
                         "airport": {
                             "iata": dep_iata,
@@ -158,7 +173,7 @@ class ManualItineraryProvider:
                             "tz": arr_air_tz,
                             "tz_short": arr_air_tz_short,
                         },
-                        "scheduled": _as_utc_iso(arr_sched_dt),
+                        "scheduled": arr_sched_iso,
                         "estimated": arr_est,
                         "actual": arr_act,
                         "terminal": arr_terminal,
@@ -1,6 +1,7 @@
 """Mock status provider using local fixtures (for testing)."""
 from __future__ import annotations
 
+import functools
 import json
 from typing import Any
 
@@ -9,6 +10,7 @@ from importlib import resources
 from .._shared.status_base import FlightStatus
 
 
+@functools.cache
 def _load_fixtures() -> dict[str, Any]:
     data = resources.files("custom_components.flight_status_tracker.fixtures").joinpath("mock_flights.json").read_text()
     return json.loads(data)
@@ -1,14 +1,21 @@
 """OpenFlights directory provider (airports/airlines from .dat files)."""
 from __future__ import annotations
 
+import asyncio
+import codecs
 import csv
+import re
+import sys
+from datetime import datetime, timezone
 from io import StringIO
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Callable
 
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
 
 from ...const import DOMAIN
+from .._shared.http import shared_api_session
 
 OPENFLIGHTS_AIRLINES_URL = "https://raw.githubusercontent.com/jpatokal/openflights/master/data/airlines.dat"
 OPENFLIGHTS_AIRPORTS_URL = "https://raw.githubusercontent.com/jpatokal/openflights/master/data/airports.dat"
@@ -16,107 +23,295 @@ OPENFLIGHTS_AIRPORTS_URL = "https://raw.githubusercontent.com/jpatokal/openfligh
 _AIRPORTS_CACHE_KEY = "openflights_airports_cache"
 _AIRLINES_CACHE_KEY = "openflights_airlines_cache"
 
+_STORE_VERSION = 1
+_STORE_KEY = f"{DOMAIN}.openflights_index"
+# Within this window the persisted index is served without any HTTP;
+# beyond it we revalidate with a conditional GET (a 304 skips the
+# download and the whole parse).
+_REVALIDATE_TTL = 24 * 3600
 
-async def _get_openflights_airports_index(
-    hass: HomeAssistant,
-    url: str,
-) -> dict[str, dict[str, Any]] | None:
-    """Download and cache an airports.dat-style file as a dict keyed by IATA."""
-    cache = hass.data.setdefault(DOMAIN, {})
-    cached = cache.get(_AIRPORTS_CACHE_KEY)
-    if isinstance(cached, dict) and cached.get("index") and cached.get("url") == url:
-        return cached["index"]
 
+def _store(hass: HomeAssistant) -> Store:
+    domain = hass.data.setdefault(DOMAIN, {})
+    st = domain.get("openflights_store")
+    if st is None:
+        st = domain["openflights_store"] = Store(hass, _STORE_VERSION, _STORE_KEY)
+    return st
+
+
+# One quoted-or-\N field; the quoted alternative safely consumes embedded
+# commas, so the per-line regex handles names like "Foo, Bar Airport".
+# Lines with escaped quotes (rare) fail the match and take the csv path.
+_Q = r'(?:"([^"]*)"|\\N)'
+# Airport ID, Name, City, Country, IATA, ICAO, Lat, Lon, Altitude,
+# Timezone offset, DST, TZ database time zone (remaining fields ignored)
+_AIRPORT_RE = re.compile(
+    rf'^\d+,{_Q},{_Q},{_Q},{_Q},{_Q},([-\d.]+|\\N),([-\d.]+|\\N),[^,]*,[^,]*,{_Q},{_Q}'
+)
+# Airline ID, Name, Alias, IATA, ICAO, Callsign, Country
+_AIRLINE_RE = re.compile(rf'^-?\d+,{_Q},{_Q},{_Q},{_Q},{_Q},{_Q},')
+
+_SRC = sys.intern("openflights")
+
+
+def _intern(s: str | None) -> str | None:
+    # Countries and time zones repeat thousands of times across the
+    # ~7700-row indices; interning collapses the duplicates to one object
+    # each and makes later equality checks pointer comparisons.
+    return sys.intern(s) if s else None
+
+
+def _airport_record(
+    iata: str,
+    icao: str | None,
+    name: str | None,
+    city: str | None,
+    country: str | None,
+    tz: str | None,
+    lat: str | None,
+    lon: str | None,
+) -> dict[str, Any]:
+    tz = (tz or "").strip()
+    if tz == "\\N":
+        tz = ""
+    # Normalize legacy alias to modern IANA name
+    if tz == "Asia/Calcutta":
+        tz = "Asia/Kolkata"
+    return {
+        "iata": sys.intern(iata),
+        "icao": (icao or "").strip() or None,
+        "name": (name or "").strip() or None,
+        "city": (city or "").strip() or None,
+        "country": _intern((country or "").strip()),
+        "tz": _intern(tz),
+        "lat": (lat or "").strip() or None,
+        "lon": (lon or "").strip() or None,
+        "source": _SRC,
+    }
+
+
+def _parse_airports(lines: list[str]) -> dict[str, dict[str, Any]]:
+    """Parse airports.dat-style lines into a dict keyed by IATA.
+
+    One precompiled regex per line captures all needed columns directly;
+    only lines the pattern cannot handle go through csv.reader.
+    """
+    index: dict[str, dict[str, Any]] = {}
+    unmatched: list[str] = []
     try:
-        session = async_get_clientsession(hass)
-        async with session.get(url, timeout=30) as resp:
-            if resp.status != 200:
-                return None
-            text = await resp.text()
+        match = _AIRPORT_RE.match
+        for line in lines:
+            m = match(line)
+            if m is None:
+                if line:
+                    unmatched.append(line)
+                continue
+            name, city, country, iata, icao, lat, lon, _dst, tz = m.groups()
+            iata = (iata or "").strip().upper()
+            if not iata:
+                continue
+            if lat == "\\N":
+                lat = None
+            if lon == "\\N":
+                lon = None
+            index[iata] = _airport_record(iata, icao, name, city, country, tz, lat, lon)
+
+        if unmatched:
+            reader = csv.reader(StringIO("\n".join(unmatched)))
+            for row in reader:
+                if len(row) < 12:
+                    continue
+                iata = (row[4] or "").strip().upper()
+                if not iata or iata == "\\N":
+                    continue
+                index[iata] = _airport_record(
+                    iata, row[5], row[1], row[2], row[3], row[11], row[6], row[7]
+                )
     except Exception:
-        return None
+        return {}
+    return index
+
 
+def _airline_record(
+    iata: str,
+    icao: str | None,
+    name: str | None,
+    country: str | None,
+) -> dict[str, Any]:
+    return {
+        "iata": sys.intern(iata),
+        "icao": (icao or "").strip() or None,
+        "name": (name or "").strip() or None,
+        "country": _intern((country or "").strip()),
+        "source": _SRC,
+    }
+
+
+def _parse_airlines(lines: list[str]) -> dict[str, dict[str, Any]]:
+    """Parse airlines.dat-style lines into a dict keyed by IATA.
+
+    Regex-first like the airports parser; lines the pattern cannot
+    handle (escaped quotes and the like) go through csv.reader, which
+    is both correct for embedded commas and faster than ad-hoc splits.
+    """
     index: dict[str, dict[str, Any]] = {}
+    unmatched: list[str] = []
     try:
-        reader = csv.reader(StringIO(text))
-        for row in reader:
-            # Format: Airport ID, Name, City, Country, IATA, ICAO, Lat, Lon,
-            # Altitude, Timezone, DST, TZ database time zone, type, source
-            if len(row) < 12:
+        match = _AIRLINE_RE.match
+        for line in lines:
+            line = line.strip()
+            if not line:
                 continue
-            iata = (row[4] or "").strip().upper()
-            if not iata or iata == "\\N":
+            m = match(line)
+            if m is None:
+                unmatched.append(line)
                 continue
-            tz = (row[11] or "").strip()
-            if tz == "\\N":
-                tz = ""
-            # Normalize legacy alias to modern IANA name
-            if tz == "Asia/Calcutta":
-                tz = "Asia/Kolkata"
-            lat = (row[6] or "").strip()
-            lon = (row[7] or "").strip()
-            index[iata] = {
-                "iata": iata,
-                "icao": (row[5] or "").strip() or None,
-                "name": (row[1] or "").strip() or None,
-                "city": (row[2] or "").strip() or None,
-                "country": (row[3] or "").strip() or None,
-                "tz": tz or None,
-                "lat": lat or None,
-                "lon": lon or None,
-                "source": "openflights",
-            }
-    except Exception:
-        return None
+            name, _alias, iata_code, icao, _callsign, country = m.groups()
+            iata_code = (iata_code or "").strip().upper()
+            if not iata_code or iata_code == "\\N":
+                continue
+            index[iata_code] = _airline_record(iata_code, icao, name, country)
 
-    cache[_AIRPORTS_CACHE_KEY] = {"index": index, "url": url}
+        if unmatched:
+            for row in csv.reader(unmatched):
+                if len(row) < 7:
+                    continue
+                iata_code = (row[3] or "").strip().upper()
+                if not iata_code or iata_code == "\\N":
+                    continue
+                index[iata_code] = _airline_record(iata_code, row[4], row[1], row[6])
+    except Exception:
+        return {}
     return index
 
 
-async def _get_openflights_airlines_index(
+async def _get_index(
     hass: HomeAssistant,
+    mem_key: str,
+    kind: str,
     url: str,
+    parse: Callable[[list[str]], dict[str, dict[str, Any]]],
 ) -> dict[str, dict[str, Any]] | None:
-    """Download and cache an airlines.dat-style file as a dict keyed by IATA."""
+    """Return the IATA index for url, persisted across restarts.
+
+    Resolution order: in-memory copy, persisted copy within TTL,
+    conditional GET (304 revalidates the persisted copy), full download
+    and parse. Network failures fall back to the stale persisted copy.
+    """
     cache = hass.data.setdefault(DOMAIN, {})
-    cached = cache.get(_AIRLINES_CACHE_KEY)
+    cached = cache.get(mem_key)
     if isinstance(cached, dict) and cached.get("index") and cached.get("url") == url:
         return cached["index"]
 
+    def _publish(index: dict[str, dict[str, Any]]) -> Any:
+        # Read-only view: the same mapping is shared by every consumer, so
+        # none of them can mutate it out from under the others. The plain
+        # dict stays in the Store payload (proxies don't JSON-serialize).
+        proxy = MappingProxyType(index)
+        cache[mem_key] = {"index": proxy, "url": url}
+        return proxy
+
+    store = _store(hass)
+    data = await store.async_load()
+    if not isinstance(data, dict):
+        data = {}
+    entry = data.get(kind)
+    if not (isinstance(entry, dict) and entry.get("url") == url and entry.get("index")):
+        entry = None
+
+    now = datetime.now(timezone.utc).timestamp()
+    if entry and now - (entry.get("fetched_at") or 0) <= _REVALIDATE_TTL:
+        return _publish(entry["index"])
+
+    headers: dict[str, str] = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
     try:
-        session = async_get_clientsession(hass)
-        async with session.get(url, timeout=30) as resp:
+        session = shared_api_session(hass)
+        async with session.get(url, timeout=30, headers=headers) as resp:
+            if resp.status == 304 and entry:
+                entry["fetched_at"] = now
+                data[kind] = entry
+                store.async_delay_save(lambda: data, 5.0)
+                return _publish(entry["index"])
             if resp.status != 200:
+                if entry:
+                    return _publish(entry["index"])
                 return None
-            text = await resp.text()
+            # Stream the body instead of buffering the whole file, and
+            # split into lines as chunks arrive so decode overlaps the
+            # TCP receive and only one copy of the data is held.
+            lines: list[str] = []
+            decoder = codecs.getincrementaldecoder("utf-8")("replace")
+            residual = ""
+            async for chunk in resp.content.iter_chunked(64 * 1024):
+                residual += decoder.decode(chunk)
+                if "\n" in residual:
+                    parts = residual.split("\n")
+                    residual = parts.pop()
+                    lines.extend(p.rstrip("\r") for p in parts)
+            residual += decoder.decode(b"", True)
+            if residual:
+                lines.append(residual.rstrip("\r"))
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
     except Exception:
+        if entry:
+            return _publish(entry["index"])
         return None
 
-    index: dict[str, dict[str, Any]] = {}
-    try:
-        for line in StringIO(text):
-            line = line.strip()
-            if not line:
-                continue
-            # Format: Airline ID, Name, Alias, IATA, ICAO, Callsign, Country, Active
-            parts = [p.strip().strip('"') for p in line.split(",")]
-            if len(parts) < 8:
-                continue
-            iata_code = (parts[3] or "").strip().upper()
-            if not iata_code or iata_code == "\\N":
-                continue
-            index[iata_code] = {
-                "iata": iata_code,
-                "icao": (parts[4] or "").strip() or None,
-                "name": (parts[1] or "").strip() or None,
-                "country": (parts[6] or "").strip() or None,
-                "source": "openflights",
-            }
-    except Exception:
+    # Parse off the event loop; the full-file scan takes tens of ms and
+    # would otherwise stall every other coroutine for that window.
+    index = await hass.async_add_executor_job(parse, lines)
+    if not index:
         return None
 
-    cache[_AIRLINES_CACHE_KEY] = {"index": index, "url": url}
-    return index
+    data[kind] = {
+        "url": url,
+        "etag": etag,
+        "last_modified": last_modified,
+        "fetched_at": now,
+        "index": index,
+    }
+    store.async_delay_save(lambda: data, 5.0)
+    return _publish(index)
+
+
+async def _get_openflights_airports_index(
+    hass: HomeAssistant,
+    url: str,
+) -> dict[str, dict[str, Any]] | None:
+    """Download (or revalidate) and cache an airports.dat-style file."""
+    return await _get_index(hass, _AIRPORTS_CACHE_KEY, "airports", url, _parse_airports)
+
+
+async def _get_openflights_airlines_index(
+    hass: HomeAssistant,
+    url: str,
+) -> dict[str, dict[str, Any]] | None:
+    """Download (or revalidate) and cache an airlines.dat-style file."""
+    return await _get_index(hass, _AIRLINES_CACHE_KEY, "airlines", url, _parse_airlines)
+
+
+async def async_preload_openflights(
+    hass: HomeAssistant,
+    airports_url: str | None = None,
+    airlines_url: str | None = None,
+) -> None:
+    """Build both indices up front so the first lookup is a dict probe.
+
+    Intended to run as a background task at setup; failures are ignored
+    and the lazy per-lookup path remains the fallback.
+    """
+    await asyncio.gather(
+        _get_openflights_airports_index(hass, airports_url or OPENFLIGHTS_AIRPORTS_URL),
+        _get_openflights_airlines_index(hass, airlines_url or OPENFLIGHTS_AIRLINES_URL),
+        return_exceptions=True,
+    )
 
 
 async def async_get_airport(
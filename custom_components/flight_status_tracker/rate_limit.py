@@ -25,6 +25,13 @@ def is_blocked(hass: HomeAssistant, provider: str) -> bool:
 def set_block(hass: HomeAssistant, provider: str, seconds: int, reason: str | None = None) -> None:
     until = datetime.now(timezone.utc) + timedelta(seconds=max(0, int(seconds)))
     _state(hass)[provider] = {"until": until, "reason": reason}
+    # A block is a definitive outcome for the call in flight: if it was
+    # the breaker's half-open probe, end the probe so breaker_open can
+    # admit another once the open window elapses. Rate limits still
+    # don't count as transport failures.
+    cb = _breakers(hass).get(provider)
+    if cb:
+        cb["probing"] = False
 
 
 def get_block_reason(hass: HomeAssistant, provider: str) -> str | None:
@@ -38,6 +45,55 @@ def get_block_until(hass: HomeAssistant, provider: str) -> datetime | None:
     return until if isinstance(until, datetime) else None
 
 
+# Circuit breaker: trips after consecutive transport failures so a dead
+# endpoint fails fast instead of costing a full timeout per call. Distinct
+# from the blocks above, which track provider-reported rate limits.
+_CB_THRESHOLD = 5
+_CB_OPEN_SECONDS = 60
+
+
+def _breakers(hass: HomeAssistant) -> dict[str, dict[str, Any]]:
+    data = hass.data.setdefault(DOMAIN, {})
+    return data.setdefault("circuit_breakers", {})
+
+
+def breaker_open(hass: HomeAssistant, provider: str) -> bool:
+    """True while provider's breaker is open (skip the call, fail fast).
+
+    Once the open window has elapsed, a single probe call is let through
+    (half-open); its outcome closes or re-trips the breaker.
+    """
+    cb = _breakers(hass).get(provider)
+    if not cb:
+        return False
+    until = cb.get("open_until")
+    if not isinstance(until, datetime):
+        return False
+    if datetime.now(timezone.utc) < until:
+        return True
+    if cb.get("probing"):
+        return True
+    cb["probing"] = True
+    return False
+
+
+def record_failure(hass: HomeAssistant, provider: str) -> None:
+    cb = _breakers(hass).setdefault(provider, {})
+    cb["probing"] = False
+    fails = cb.get("failures", 0) + 1
+    cb["failures"] = fails
+    if fails >= _CB_THRESHOLD:
+        cb["open_until"] = datetime.now(timezone.utc) + timedelta(seconds=_CB_OPEN_SECONDS)
+
+
+def record_success(hass: HomeAssistant, provider: str) -> None:
+    cb = _breakers(hass).get(provider)
+    if cb:
+        cb["failures"] = 0
+        cb["open_until"] = None
+        cb["probing"] = False
+
+
 def get_blocks(hass: HomeAssistant) -> dict[str, dict[str, Any]]:
     blocks: dict[str, dict[str, Any]] = {}
     for provider, info in _state(hass).items():
@@ -9,7 +9,7 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from .const import EVENT_UPDATED, SIGNAL_MANUAL_FLIGHTS_UPDATED
+from .const import SIGNAL_MANUAL_FLIGHTS_UPDATED, SIGNAL_UPDATED
 
 SENSOR_ENTITY_ID = "sensor.flight_status_tracker_upcoming_flights"
 
@@ -48,7 +48,7 @@ class FlightDashboardRemoveFlightSelect(SelectEntity):
             self.hass.async_create_task(self._refresh_options())
 
         self._unsub_state = async_track_state_change_event(self.hass, [SENSOR_ENTITY_ID], _kick)
-        self._unsub_bus = self.hass.bus.async_listen(EVENT_UPDATED, _kick)
+        self._unsub_bus = async_dispatcher_connect(self.hass, SIGNAL_UPDATED, _kick)
         self._unsub_dispatcher = async_dispatcher_connect(self.hass, SIGNAL_MANUAL_FLIGHTS_UPDATED, _kick)
 
         await self._refresh_options()
@@ -105,7 +105,7 @@ class FlightDashboardSelectedFlightSelect(SelectEntity):
             self.hass.async_create_task(self._refresh_options())
 
         self._unsub_state = async_track_state_change_event(self.hass, [SENSOR_ENTITY_ID], _kick)
-        self._unsub_bus = self.hass.bus.async_listen(EVENT_UPDATED, _kick)
+        self._unsub_bus = async_dispatcher_connect(self.hass, SIGNAL_UPDATED, _kick)
         self._unsub_dispatcher = async_dispatcher_connect(self.hass, SIGNAL_MANUAL_FLIGHTS_UPDATED, _kick)
 
         await self._refresh_options()
@@ -16,14 +16,14 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import async_track_point_in_utc_time, async_track_time_interval, async_track_state_change_event
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, SIGNAL_MANUAL_FLIGHTS_UPDATED, EVENT_UPDATED
+from .const import DOMAIN, SIGNAL_MANUAL_FLIGHTS_UPDATED, EVENT_UPDATED, SIGNAL_UPDATED
 from .coordinator_agg import merge_segments
 from .providers.manual.itinerary import ManualItineraryProvider
 from .manual_store import async_remove_manual_flight, async_update_manual_flight
 from .status_manager import async_update_statuses
 from .status_resolver import _normalize_iso_in_tz
 from .tz_short import tz_short_name
-from .directory import get_airport, get_airline, warm_directory_cache
+from .directory import async_enrich, warm_directory_cache
 from .providers.flightradar24.client import FR24Client, FR24RateLimitError, FR24Error
 from .rate_limit import get_blocks, is_blocked, get_block_until, get_block_reason, set_block
 from .selected import get_selected_flight, get_flight_position
@@ -144,6 +144,11 @@ class FlightDashboardUpcomingFlightsSensor(SensorEntity):
             "schema_doc": SCHEMA_DOC,
             "schema_example": SCHEMA_EXAMPLE,
             "flights": self._flights,
+            # Precomputed index so consumers can test membership in O(1)
+            # instead of scanning the flights list.
+            "flight_key_set": [
+                f.get("flight_key") for f in self._flights if isinstance(f, dict)
+            ],
         }
 
     async def _rebuild(self) -> None:
@@ -269,18 +274,38 @@ class FlightDashboardUpcomingFlightsSensor(SensorEntity):
             dep_sched = dep.get("scheduled")
             arr_sched = arr.get("scheduled")
 
-            # Enrich from directory cache/providers (optional)
+            # Enrich from directory cache/providers (optional); the dep/arr
+            # airport and airline lookups are independent, so they are
+            # resolved concurrently.
             airline_code = flight.get("airline_code")
-            if airline_code and not flight.get("airline_name"):
-                airline = await get_airline(self.hass, options, airline_code)
-                if airline:
-                    flight["airline_name"] = airline.get("name") or flight.get("airline_name")
-                    if not flight.get("airline_logo_url"):
-                        flight["airline_logo_url"] = airline.get("logo") or flight.get("airline_logo_url")
+            need_airline = bool(airline_code and not flight.get("airline_name"))
+            dep_iata = dep_air.get("iata")
+            need_dep = bool(
+                dep_iata and (not dep_air.get("name") or not dep_air.get("city") or not dep_air.get("tz"))
+            )
+            arr_iata = arr_air.get("iata")
+            need_arr = bool(
+                arr_iata and (not arr_air.get("name") or not arr_air.get("city") or not arr_air.get("tz"))
+            )
+
+            dep_airport = arr_airport = airline = None
+            if need_airline or need_dep or need_arr:
+                dep_airport, arr_airport, airline = await async_enrich(
+                    self.hass,
+                    options,
+                    dep_iata if need_dep else None,
+                    arr_iata if need_arr else None,
+                    airline_code if need_airline else None,
+                )
+
+            if airline:
+                flight["airline_name"] = airline.get("name") or flight.get("airline_name")
+                if not flight.get("airline_logo_url"):
+                    flight["airline_logo_url"] = airline.get("logo") or flight.get("airline_logo_url")
 
             updates: dict[str, Any] = {}
-            if dep_air.get("iata") and (not dep_air.get("name") or not dep_air.get("city") or not dep_air.get("tz")):
-                airport = await get_airport(self.hass, options, dep_air.get("iata"))
+            if need_dep:
+                airport = dep_airport
                 if airport:
                     if not dep_air.get("name") and airport.get("name"):
                         dep_air["name"] = airport.get("name")
@@ -292,8 +317,8 @@ class FlightDashboardUpcomingFlightsSensor(SensorEntity):
                         dep_air["tz"] = airport.get("tz")
                         updates["dep_airport_tz"] = airport.get("tz")
 
-            if arr_air.get("iata") and (not arr_air.get("name") or not arr_air.get("city") or not arr_air.get("tz")):
-                airport = await get_airport(self.hass, options, arr_air.get("iata"))
+            if need_arr:
+                airport = arr_airport
                 if airport:
                     if not arr_air.get("name") and airport.get("name"):
                         arr_air["name"] = airport.get("name")
@@ -408,7 +433,7 @@ class FlightDashboardSelectedFlightSensor(SensorEntity):
             ["sensor.flight_status_tracker_upcoming_flights", "select.flight_status_tracker_selected_flight"],
             _kick,
         )
-        self._unsub_bus = self.hass.bus.async_listen(EVENT_UPDATED, _kick)
+        self._unsub_bus = async_dispatcher_connect(self.hass, SIGNAL_UPDATED, _kick)
 
         await self._refresh()
 
@@ -31,16 +31,24 @@ def _store(hass: HomeAssistant, key: str) -> Store:
 # Preview (single object storage)
 # ----------------------------
 async def async_load_preview(hass: HomeAssistant) -> dict[str, Any] | None:
-    """Load the current add-flight preview object."""
+    """Load the current add-flight preview object.
+
+    Writers push the current preview into hass.data, so after the first
+    disk read every load is an in-memory lookup.
+    """
+    domain = hass.data.setdefault(DOMAIN, {})
+    if "preview" in domain:
+        return domain["preview"]
     data = await _store(hass, _STORE_PREVIEW).async_load()
-    if not data:
-        return None
-    preview = data.get("preview")
-    return preview if isinstance(preview, dict) else None
+    preview = data.get("preview") if data else None
+    preview = preview if isinstance(preview, dict) else None
+    domain["preview"] = preview
+    return preview
 
 
 async def async_save_preview(hass: HomeAssistant, preview: dict[str, Any]) -> None:
     """Save the add-flight preview object."""
+    hass.data.setdefault(DOMAIN, {})["preview"] = preview
     await _store(hass, _STORE_PREVIEW).async_save(
         {
             "schema_version": SCHEMA_VERSION,
@@ -51,6 +59,7 @@ async def async_save_preview(hass: HomeAssistant, preview: dict[str, Any]) -> No
 
 async def async_clear_preview(hass: HomeAssistant) -> None:
     """Clear the add-flight preview object."""
+    hass.data.setdefault(DOMAIN, {})["preview"] = None
     await _store(hass, _STORE_PREVIEW).async_save(
         {
             "schema_version": SCHEMA_VERSION,